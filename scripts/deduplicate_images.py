@@ -5,37 +5,88 @@
 """
 
 import json
+import os
+import sys
 from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import ijson
+except ImportError:  # ijson 미설치 시 전체 로드 방식 사용 (pip install "ggp-store-parser[scripts]")
+    ijson = None
 
-def deduplicate_image_urls(input_path: Path, output_path: Path) -> dict:
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용 (pip install "ggp-store-parser[scripts]")
+    orjson = None
+
+# 전체 이미지 URL 수가 이 값을 넘으면 그룹 병합을 멀티프로세스로 처리
+PARALLEL_URL_THRESHOLD = 200_000
+
+
+def iter_items(input_path: Path) -> Iterator[dict]:
     """
-    이미지 URL 중복 제거 및 상품 병합
+    JSON 배열의 항목을 하나씩 반환
 
-    Args:
-        input_path: 원본 JSON 파일 경로
-        output_path: 출력 JSON 파일 경로
+    ijson이 설치되어 있으면 파일 전체를 메모리에 올리지 않고 스트리밍으로 파싱합니다.
+    """
+    if ijson is not None:
+        with open(input_path, "rb") as f:
+            # use_float: 다른 백엔드와 같이 숫자를 float로 (Decimal은 직렬화 불가)
+            yield from ijson.items(f, "item", use_float=True)
+        return
 
-    Returns:
-        통계 정보 딕셔너리
+    if orjson is not None:
+        data = orjson.loads(input_path.read_bytes())
+    else:
+        with open(input_path, encoding="utf-8") as f:
+            data = json.load(f)
+    yield from data
+
+
+def dump_item(item: dict) -> bytes:
+    """단일 항목을 들여쓰기(2칸)된 JSON 바이트로 직렬화"""
+    if orjson is not None:
+        return orjson.dumps(item, option=orjson.OPT_INDENT_2)
+    return json.dumps(item, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_json_array(output_path: Path, items: list[dict]) -> None:
     """
-    # 원본 데이터 로드
-    with open(input_path, encoding="utf-8") as f:
-        data = json.load(f)
+    JSON 배열을 항목 단위로 기록
 
-    # 상품명 기준으로 그룹화
-    products_by_name = defaultdict(list)
-    for item in data:
-        products_by_name[item["name"]].append(item)
+    전체 결과를 하나의 문자열로 직렬화하지 않고 항목마다 바로 파일에 쓰므로
+    저장 시 메모리 사용량이 항목 하나 크기로 제한됩니다.
+    출력 형식은 json.dump(..., indent=2)와 동일합니다.
+    """
+    with open(output_path, "wb") as f:
+        if not items:
+            f.write(b"[]")
+            return
 
-    # 중복 제거 및 병합
-    deduplicated = []
-    original_image_count = 0
-    unique_image_count = 0
+        f.write(b"[\n")
+        for i, item in enumerate(items):
+            if i:
+                f.write(b",\n")
+            f.write(b"  " + dump_item(item).replace(b"\n", b"\n  "))
+        f.write(b"\n]")
+
+
+def merge_groups(groups: list[tuple[str, list[dict]]]) -> list[dict]:
+    """
+    상품명별 항목 그룹을 하나의 항목으로 병합
 
-    for name, items in products_by_name.items():
+    Args:
+        groups: (상품명, 항목 목록) 튜플 리스트
+
+    Returns:
+        병합된 항목 리스트
+    """
+    merged_items = []
+    for name, items in groups:
         # 첫 번째 항목을 기준으로 병합
         merged = {
             "id": items[0]["id"],
@@ -43,32 +94,59 @@ def deduplicate_image_urls(input_path: Path, output_path: Path) -> dict:
             "url": items[0]["url"]
         }
 
-        # 모든 이미지 URL 수집
-        all_urls = []
-        for item in items:
-            all_urls.extend(item.get("image_urls", []))
-            original_image_count += len(item.get("image_urls", []))
-
-        # 중복 제거 (순서 유지)
-        unique_urls = []
-        seen = set()
-        for url in all_urls:
-            if url not in seen:
-                unique_urls.append(url)
-                seen.add(url)
+        # 모든 이미지 URL을 한 번에 순회하며 중복 제거 (순서 유지)
+        unique_urls = list(dict.fromkeys(url for item in items for url in item["image_urls"]))
 
         merged["image_urls"] = unique_urls
         merged["image_count"] = len(unique_urls)
-        unique_image_count += len(unique_urls)
 
-        deduplicated.append(merged)
+        merged_items.append(merged)
+    return merged_items
+
+
+def deduplicate_image_urls(input_path: Path, output_path: Path) -> dict:
+    """
+    이미지 URL 중복 제거 및 상품 병합
+
+    Args:
+        input_path: 원본 JSON 파일 경로
+        output_path: 출력 JSON 파일 경로
+
+    Returns:
+        통계 정보 딕셔너리
+    """
+    # 원본 데이터를 스트리밍으로 읽으며 상품명 기준으로 그룹화
+    products_by_name = defaultdict(list)
+    original_entries = 0
+    original_image_count = 0
+    for item in iter_items(input_path):
+        # 상품명/URL은 항목 간 중복이 많으므로 intern하여 하나의 문자열만 유지
+        item["name"] = sys.intern(item["name"])
+        item["image_urls"] = [sys.intern(url) for url in item.get("image_urls", [])]
+        products_by_name[item["name"]].append(item)
+        original_entries += 1
+        original_image_count += len(item["image_urls"])
+
+    # 중복 제거 및 병합 (URL이 많으면 그룹을 나눠 여러 프로세스에서 처리)
+    groups = list(products_by_name.items())
+    workers = os.cpu_count() or 1
+    if original_image_count > PARALLEL_URL_THRESHOLD and workers > 1:
+        chunk_size = -(-len(groups) // workers)
+        chunks = [groups[i:i + chunk_size] for i in range(0, len(groups), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            deduplicated = [
+                merged for result in executor.map(merge_groups, chunks) for merged in result
+            ]
+    else:
+        deduplicated = merge_groups(groups)
+
+    unique_image_count = sum(merged["image_count"] for merged in deduplicated)
 
     # 정렬 (상품명 기준)
     deduplicated.sort(key=lambda x: x["name"])
 
     # 결과 저장
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(deduplicated, f, ensure_ascii=False, indent=2)
+    write_json_array(output_path, deduplicated)
 
     # 통계 계산
     reduction_rate = (
@@ -78,7 +156,7 @@ def deduplicate_image_urls(input_path: Path, output_path: Path) -> dict:
     )
 
     return {
-        "original_entries": len(data),
+        "original_entries": original_entries,
         "deduplicated_entries": len(deduplicated),
         "original_images": original_image_count,
         "unique_images": unique_image_count,
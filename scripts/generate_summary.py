@@ -5,56 +5,74 @@ CSV 파일을 읽어서 상세 통계를 생성합니다.
 """
 
 import csv
+import heapq
+import re
+from array import array
 from collections import Counter
 from pathlib import Path
 
+# 상품명 키워드 기반 카테고리 분류 규칙 (앞쪽 규칙이 우선)
+CATEGORY_KEYWORDS = [
+    ('Hoodie/Jacket', ('HOODIE', 'ZIP')),
+    ('T-Shirt', ('TEE', 'T-')),
+    ('Sweatshirt', ('SWEATSHIRT', 'CREW')),
+    ('Cap', ('CAP',)),
+    ('Jersey', ('JERSEY',)),
+    ('Windbreaker', ('WINDBREAKER',)),
+]
+
+# 키워드 -> 규칙 순번
+KEYWORD_PRIORITY = {
+    keyword: priority
+    for priority, (_, keywords) in enumerate(CATEGORY_KEYWORDS)
+    for keyword in keywords
+}
+
+# 모든 키워드를 하나의 패턴으로 묶어 상품명을 한 번만 훑음 (다중 패턴 검색)
+# lookahead로 감싸 겹치는 키워드(예: SWEATSHIRT-의 T-)도 모두 찾음
+KEYWORD_RE = re.compile('(?=(' + '|'.join(map(re.escape, KEYWORD_PRIORITY)) + '))')
+
+
+def classify_category(name: str) -> str:
+    """상품명으로 카테고리 분류"""
+    keywords = KEYWORD_RE.findall(name.upper())
+    priority = min(map(KEYWORD_PRIORITY.__getitem__, keywords), default=None)
+    return CATEGORY_KEYWORDS[priority][0] if priority is not None else 'Other'
+
 
 def generate_summary(csv_file_path: Path):
     """CSV 파일에서 통계 생성"""
 
-    products = []
+    # 필요한 두 열만 열(column) 단위로 적재
+    names: list[str] = []
+    image_counts = array('i')
 
     with open(csv_file_path, encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            products.append(row)
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if header:
+            name_col = header.index('Product Name')
+            count_col = header.index('Image Count')
+            for row in reader:
+                names.append(row[name_col])
+                image_counts.append(int(row[count_col]))
 
     # 기본 통계
-    total_products = len(products)
-    total_images = sum(int(p['Image Count']) for p in products)
+    total_products = len(names)
+    total_images = sum(image_counts)
     avg_images = total_images / total_products if total_products > 0 else 0
 
     # 이미지 수 분포
-    image_counts = [int(p['Image Count']) for p in products]
-    min_images = min(image_counts) if image_counts else 0
-    max_images = max(image_counts) if image_counts else 0
-
-    # 상위 5개 제품 (이미지 수 기준)
-    top_5_products = sorted(products, key=lambda x: int(x['Image Count']), reverse=True)[:5]
+    min_images = min(image_counts, default=0)
+    max_images = max(image_counts, default=0)
 
-    # 하위 5개 제품 (이미지 수 기준)
-    bottom_5_products = sorted(products, key=lambda x: int(x['Image Count']))[:5]
+    # 상위/하위 5개 제품 (이미지 수 기준, 행 인덱스로 선택)
+    rows = range(total_products)
+    top_5_products = heapq.nlargest(5, rows, key=image_counts.__getitem__)
+    bottom_5_products = heapq.nsmallest(5, rows, key=image_counts.__getitem__)
 
     # 제품 카테고리 분석 (이름에서 추출)
-    categories = []
-    for p in products:
-        name = p['Product Name'].upper()
-        if 'HOODIE' in name or 'ZIP' in name:
-            categories.append('Hoodie/Jacket')
-        elif 'TEE' in name or 'T-' in name:
-            categories.append('T-Shirt')
-        elif 'SWEATSHIRT' in name or 'CREW' in name:
-            categories.append('Sweatshirt')
-        elif 'CAP' in name:
-            categories.append('Cap')
-        elif 'JERSEY' in name:
-            categories.append('Jersey')
-        elif 'WINDBREAKER' in name:
-            categories.append('Windbreaker')
-        else:
-            categories.append('Other')
-
-    category_counts = Counter(categories)
+    category_counts = Counter(map(classify_category, names))
 
     # 출력
     print("=" * 70)
@@ -77,13 +95,13 @@ def generate_summary(csv_file_path: Path):
     print()
 
     print("[이미지가 가장 많은 제품 TOP 5]")
-    for i, product in enumerate(top_5_products, 1):
-        print(f"  {i}. {product['Product Name'][:50]:50s} - {product['Image Count']:2s}개")
+    for i, row in enumerate(top_5_products, 1):
+        print(f"  {i}. {names[row][:50]:50s} - {image_counts[row]:<2d}개")
     print()
 
     print("[이미지가 가장 적은 제품 TOP 5]")
-    for i, product in enumerate(bottom_5_products, 1):
-        print(f"  {i}. {product['Product Name'][:50]:50s} - {product['Image Count']:2s}개")
+    for i, row in enumerate(bottom_5_products, 1):
+        print(f"  {i}. {names[row][:50]:50s} - {image_counts[row]:<2d}개")
     print()
 
     print("[파일 정보]")
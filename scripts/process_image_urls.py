@@ -9,8 +9,24 @@ Image URLs JSON to Google Sheets CSV Processor
 
 import csv
 import json
+import re
+import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import unquote_plus
+
+try:
+    import ijson
+except ImportError:  # ijson 미설치 시 전체 로드 방식 사용 (pip install "ggp-store-parser[scripts]")
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용 (pip install "ggp-store-parser[scripts]")
+    orjson = None
+
+# 쿼리 문자열의 variant 값 (URL 전체를 파싱하지 않고 해당 키만 추출)
+VARIANT_RE = re.compile(r'[?&]variant=([^&#]+)')
 
 
 def clean_url(url: str) -> str:
@@ -20,12 +36,27 @@ def clean_url(url: str) -> str:
 
 def extract_variant_id(url: str) -> str:
     """URL에서 variant ID 추출"""
-    parsed = urlparse(url)
-    query_params = parse_qs(parsed.query)
-    return query_params.get('variant', [''])[0]
+    match = VARIANT_RE.search(url)
+    return unquote_plus(match.group(1)) if match else ''
+
+
+def iter_products(input_path: Path) -> Iterator[dict]:
+    """JSON 배열의 제품을 하나씩 반환 (ijson 사용 시 스트리밍 파싱)"""
+    if ijson is not None:
+        with open(input_path, 'rb') as f:
+            # use_float: 다른 백엔드와 같이 숫자를 float로 (Decimal은 직렬화 불가)
+            yield from ijson.items(f, 'item', use_float=True)
+        return
 
+    if orjson is not None:
+        products = orjson.loads(input_path.read_bytes())
+    else:
+        with open(input_path, encoding='utf-8') as f:
+            products = json.load(f)
+    yield from products
 
-def deduplicate_products(products: list[dict]) -> list[dict]:
+
+def deduplicate_products(products: Iterable[dict]) -> list[dict]:
     """
     중복 제품 제거
     - 같은 product ID를 가진 제품들을 하나로 통합
@@ -34,7 +65,9 @@ def deduplicate_products(products: list[dict]) -> list[dict]:
     unique_products = {}
 
     for product in products:
-        product_id = product['id']
+        product_id = sys.intern(product['id'])
+        # 변형(variant) 간 중복되는 이미지 URL 문자열을 하나로 공유
+        product['image_urls'] = [sys.intern(url) for url in product['image_urls']]
 
         if product_id not in unique_products:
             # 첫 번째 제품 등록
@@ -42,12 +75,20 @@ def deduplicate_products(products: list[dict]) -> list[dict]:
             product['variant_id'] = extract_variant_id(product['url'])
             unique_products[product_id] = product
         else:
-            # 이미 있는 제품이면 이미지 URL 병합 (중복 제거)
+            # 이미 있는 제품이면 이미지 URL 병합 (중복 제거, 순서 유지)
+            # 병합용 dict(순서 있는 집합)는 제품당 한 번만 만들고 계속 갱신
             existing = unique_products[product_id]
-            new_images = set(existing['image_urls'])
-            new_images.update(product['image_urls'])
-            existing['image_urls'] = list(new_images)
-            existing['image_count'] = len(existing['image_urls'])
+            merged_urls = existing.get('_merged_urls')
+            if merged_urls is None:
+                merged_urls = existing['_merged_urls'] = dict.fromkeys(existing['image_urls'])
+            merged_urls.update(dict.fromkeys(product['image_urls']))
+
+    # 병합된 제품의 이미지 목록 확정
+    for product in unique_products.values():
+        merged_urls = product.pop('_merged_urls', None)
+        if merged_urls is not None:
+            product['image_urls'] = list(merged_urls)
+            product['image_count'] = len(product['image_urls'])
 
     return list(unique_products.values())
 
@@ -65,21 +106,19 @@ def create_csv(products: list[dict], output_path: Path):
             'Image URLs'
         ]
 
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
 
         for product in products:
-            # 이미지 URL을 파이프(|)로 구분
-            image_urls_str = ' | '.join(product['image_urls'])
-
-            writer.writerow({
-                'Product ID': product['id'],
-                'Product Name': product['name'],
-                'Product URL': product['url'],
-                'Variant ID': product.get('variant_id', ''),
-                'Image Count': product['image_count'],
-                'Image URLs': image_urls_str
-            })
+            writer.writerow((
+                product['id'],
+                product['name'],
+                product['url'],
+                product.get('variant_id', ''),
+                product['image_count'],
+                # 이미지 URL을 파이프(|)로 구분
+                ' | '.join(product['image_urls']),
+            ))
 
 
 def main():
@@ -92,18 +131,21 @@ def main():
 
     print(f"[INFO] JSON 파일 읽기: {input_file}")
 
-    # JSON 파일 읽기
-    with open(input_file, encoding='utf-8') as f:
-        products = json.load(f)
+    # JSON 파일을 스트리밍으로 읽으며 중복 제거
+    print("[INFO] 중복 제품 제거 중...")
+    total_entries = 0
 
-    print(f"[SUCCESS] 총 {len(products)}개 항목 로드")
+    def counted_products() -> Iterator[dict]:
+        nonlocal total_entries
+        for product in iter_products(input_file):
+            total_entries += 1
+            yield product
 
-    # 중복 제거
-    print("[INFO] 중복 제품 제거 중...")
-    unique_products = deduplicate_products(products)
+    unique_products = deduplicate_products(counted_products())
 
+    print(f"[SUCCESS] 총 {total_entries}개 항목 로드")
     print(f"[SUCCESS] 중복 제거 완료: {len(unique_products)}개 고유 제품")
-    print(f"[INFO] 제거된 중복: {len(products) - len(unique_products)}개")
+    print(f"[INFO] 제거된 중복: {total_entries - len(unique_products)}개")
 
     # CSV 생성
     print(f"[INFO] CSV 파일 생성: {output_file}")
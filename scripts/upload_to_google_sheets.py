@@ -6,12 +6,58 @@ Google Sheets API를 사용합니다.
 """
 
 import csv
+import functools
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+# values.append 한 번에 보낼 최대 행 수 (요청 크기 제한 회피)
+UPLOAD_CHUNK_ROWS = 5000
+
+# Google Sheets API 스코프
+SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive.file'
+]
+
+# Service Account 인증 파일
+CREDENTIALS_PATH = Path(r'D:\AI\claude01\ggp_store_parser\credentials.json')
+
+
+@functools.lru_cache(maxsize=1)
+def get_services(credentials_path: Path):
+    """
+    Sheets/Drive API 서비스 생성 (결과 캐시)
+
+    인증 정보 로드와 discovery 문서 요청은 네트워크 왕복이 필요하므로
+    같은 인증 파일에 대해서는 한 번만 수행합니다.
+
+    Returns:
+        (sheets 서비스, drive 서비스) 튜플
+    """
+    creds = service_account.Credentials.from_service_account_file(
+        str(credentials_path),
+        scopes=SCOPES
+    )
+    sheets_service = build('sheets', 'v4', credentials=creds, cache_discovery=False)
+    drive_service = build('drive', 'v3', credentials=creds, cache_discovery=False)
+    return sheets_service, drive_service
+
+
+def iter_row_chunks(rows: Iterable[list[str]], size: int) -> Iterator[list[list[str]]]:
+    """행을 size개 단위 청크로 묶어서 반환"""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
 
 def upload_csv_to_sheets(csv_file_path: Path, spreadsheet_name: str = "GGP Store Image URLs"):
     """
@@ -22,15 +68,9 @@ def upload_csv_to_sheets(csv_file_path: Path, spreadsheet_name: str = "GGP Store
         spreadsheet_name: 생성할 스프레드시트 이름
     """
 
-    # Google Sheets API 스코프
-    SCOPES = [
-        'https://www.googleapis.com/auth/spreadsheets',
-        'https://www.googleapis.com/auth/drive.file'
-    ]
-
     try:
         # Service Account 인증 (credentials.json 필요)
-        credentials_path = Path(r'D:\AI\claude01\ggp_store_parser\credentials.json')
+        credentials_path = CREDENTIALS_PATH
 
         if not credentials_path.exists():
             print("[ERROR] credentials.json 파일이 없습니다.")
@@ -41,24 +81,8 @@ def upload_csv_to_sheets(csv_file_path: Path, spreadsheet_name: str = "GGP Store
             print(f"경로: {credentials_path}")
             return None
 
-        creds = service_account.Credentials.from_service_account_file(
-            str(credentials_path),
-            scopes=SCOPES
-        )
-
-        # Google Sheets API 서비스 생성
-        service = build('sheets', 'v4', credentials=creds)
-        drive_service = build('drive', 'v3', credentials=creds)
-
-        # CSV 파일 읽기
-        print(f"[INFO] CSV 파일 읽기: {csv_file_path}")
-        values = []
-        with open(csv_file_path, encoding='utf-8-sig') as f:
-            csv_reader = csv.reader(f)
-            for row in csv_reader:
-                values.append(row)
-
-        print(f"[SUCCESS] {len(values)}행 읽기 완료 (헤더 포함)")
+        # Google Sheets / Drive API 서비스 (여러 번 업로드해도 한 번만 생성)
+        service, drive_service = get_services(credentials_path)
 
         # 스프레드시트 생성
         print(f"[INFO] 스프레드시트 생성: {spreadsheet_name}")
@@ -80,20 +104,24 @@ def upload_csv_to_sheets(csv_file_path: Path, spreadsheet_name: str = "GGP Store
         print(f"ID: {spreadsheet_id}")
         print(f"URL: {spreadsheet_url}")
 
-        # 데이터 업로드
-        print("[INFO] 데이터 업로드 중...")
-        body = {
-            'values': values
-        }
-
-        result = service.spreadsheets().values().update(
-            spreadsheetId=spreadsheet_id,
-            range='Sheet1!A1',
-            valueInputOption='RAW',
-            body=body
-        ).execute()
-
-        print(f"[SUCCESS] {result.get('updatedCells')}개 셀 업데이트 완료")
+        # 데이터 업로드 (CSV를 읽으며 청크 단위로 추가)
+        print(f"[INFO] CSV 파일 업로드 중: {csv_file_path}")
+        row_count = 0
+        updated_cells = 0
+        with open(csv_file_path, encoding='utf-8-sig') as f:
+            for chunk in iter_row_chunks(csv.reader(f), UPLOAD_CHUNK_ROWS):
+                result = service.spreadsheets().values().append(
+                    spreadsheetId=spreadsheet_id,
+                    range='Sheet1!A1',
+                    valueInputOption='RAW',
+                    insertDataOption='INSERT_ROWS',
+                    body={'values': chunk}
+                ).execute()
+                row_count += len(chunk)
+                updated_cells += result.get('updates', {}).get('updatedCells', 0)
+                print(f"[INFO] {row_count}행 업로드")
+
+        print(f"[SUCCESS] {row_count}행 (헤더 포함), {updated_cells}개 셀 업데이트 완료")
 
         # 헤더 행 서식 지정
         print("[INFO] 서식 적용 중...")
@@ -0,0 +1,85 @@
+"""File helpers shared by the metadata and checklist writers."""
+
+import gzip
+import os
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install "ggp-store-parser[zstd]"
+    zstandard = None
+
+# Compression is chosen from the last suffix, e.g. metadata.json.gz
+COMPRESSED_SUFFIXES = (".gz", ".zst")
+
+
+def data_suffix(path: Path) -> str:
+    """Suffix describing the content format, ignoring a compression suffix.
+
+    ``checklist.json.zst`` -> ``.json``
+    """
+    if path.suffix in COMPRESSED_SUFFIXES:
+        return Path(path.stem).suffix
+    return path.suffix
+
+
+def read_text(path: Path) -> str:
+    """Read a UTF-8 text file, decompressing ``.gz``/``.zst`` files."""
+    return read_bytes(path).decode("utf-8")
+
+
+def read_bytes(path: Path) -> bytes:
+    """Read a file's content, decompressing ``.gz``/``.zst`` files."""
+    data = path.read_bytes()
+    if path.suffix == ".gz":
+        data = gzip.decompress(data)
+    elif path.suffix == ".zst":
+        data = _zstandard().ZstdDecompressor().decompressobj().decompress(data)
+    return data
+
+
+def write_text(path: Path, text: str, fsync: bool = False) -> None:
+    """Atomically write a UTF-8 text file, compressing ``.gz``/``.zst`` files.
+
+    See write_bytes().
+    """
+    write_bytes(path, text.encode("utf-8"), fsync=fsync)
+
+
+def write_bytes(path: Path, data: bytes, fsync: bool = False) -> None:
+    """Atomically write a file, compressing ``.gz``/``.zst`` files.
+
+    The content goes to a temporary sibling that replaces ``path`` once
+    complete, so a crash never leaves a truncated file behind.
+
+    Args:
+        path: Destination file
+        data: File content
+        fsync: Flush the data to disk before the rename, so the new content
+            also survives power loss (slower)
+    """
+    if path.suffix == ".gz":
+        data = gzip.compress(data, compresslevel=6, mtime=0)
+    elif path.suffix == ".zst":
+        data = _zstandard().ZstdCompressor(level=3).compress(data)
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _zstandard():
+    """Return the zstandard module or explain how to get it."""
+    if zstandard is None:
+        raise RuntimeError(
+            '.zst files need the zstandard package (pip install "ggp-store-parser[zstd]")'
+        )
+    return zstandard
@@ -0,0 +1,10 @@
+"""HTTP settings shared by the browser crawler and the image downloader."""
+
+# Browser user agent sent with every request to avoid bot detection
+DEFAULT_UA = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+DEFAULT_HEADERS = {"User-Agent": DEFAULT_UA}
@@ -7,6 +7,14 @@ from pathlib import Path
 import yaml
 from pydantic import BaseModel, Field
 
+from ._files import data_suffix, read_text, write_text
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
 
 class JobStatus(str, Enum):
     """Status of a crawling job or task."""
@@ -214,23 +222,40 @@ class StoreParserChecklist(BaseModel):
     stats: Stats = Field(default_factory=Stats)
     metadata_sync: MetadataSync = Field(default_factory=MetadataSync)
 
-    def save(self, filepath: Path | str) -> None:
-        """Save checklist to YAML file."""
+    def save(self, filepath: Path | str, fsync: bool = False) -> None:
+        """Save checklist to file.
+
+        Paths ending in ``.json`` are written as JSON, anything else as YAML;
+        a further ``.gz`` or ``.zst`` suffix compresses the file. Callers that
+        track changes themselves (see ChecklistManager) skip unchanged saves.
+
+        Args:
+            filepath: Destination file
+            fsync: Force the file to disk before it replaces the old one
+        """
         filepath = Path(filepath)
         self.updated_at = datetime.now()
-        data = self.model_dump(mode="json")
-        filepath.write_text(
-            yaml.dump(data, allow_unicode=True, default_flow_style=False, sort_keys=False),
-            encoding="utf-8",
+        text = self.model_dump_json() if data_suffix(filepath) == ".json" else self.to_yaml()
+        write_text(filepath, text, fsync=fsync)
+
+    def to_yaml(self) -> str:
+        """Export checklist as YAML for human inspection."""
+        return yaml.dump(
+            self.model_dump(mode="json"),
+            Dumper=SafeDumper,
+            allow_unicode=True,
+            default_flow_style=False,
+            sort_keys=False,
         )
 
     @classmethod
     def load(cls, filepath: Path | str) -> "StoreParserChecklist":
-        """Load checklist from YAML file."""
+        """Load checklist from a (possibly compressed) JSON or YAML file."""
         filepath = Path(filepath)
         if not filepath.exists():
             return cls()
-        data = yaml.safe_load(filepath.read_text(encoding="utf-8"))
-        if data is None:
-            return cls()
-        return cls.model_validate(data)
+        text = read_text(filepath)
+        if data_suffix(filepath) == ".json":
+            return cls.model_validate_json(text) if text.strip() else cls()
+        data = yaml.load(text, Loader=SafeLoader)
+        return cls() if data is None else cls.model_validate(data)
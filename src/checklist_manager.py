@@ -1,8 +1,15 @@
 """Checklist manager for GGStore crawling tasks."""
 
+import json
+import time
 import uuid
+from collections import defaultdict
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO
+
+from pydantic import BaseModel
 
 from .checklist import (
     CrawlJob,
@@ -13,30 +20,226 @@ from .checklist import (
     JobResult,
     JobStatus,
     JobType,
+    MetadataSync,
     ProductCrawlInfo,
     ProductEntry,
     ProductImageStatus,
     ProductPrice,
     SessionProgress,
+    Stats,
     StoreParserChecklist,
 )
 from .models import CrawlResult
 
 
+@dataclass(slots=True)
+class _ProgressCounters:
+    """Plain mirror of SessionProgress for cheap per-event updates."""
+
+    products_discovered: int = 0
+    products_crawled: int = 0
+    products_skipped: int = 0
+    images_downloaded: int = 0
+    images_failed: int = 0
+    current_page: int = 1
+    last_product_url: str | None = None
+
+
 class ChecklistManager:
-    """Manager for the crawling checklist."""
+    """Manager for the crawling checklist.
 
-    def __init__(self, checklist_path: Path | str = "store_parser_checklist.yaml"):
-        self.checklist_path = Path(checklist_path)
-        self.checklist = StoreParserChecklist.load(self.checklist_path)
+    Every mutation is appended to a JSON Lines journal next to the checklist
+    (``<name>.journal``) holding the changed entries only. The full checklist
+    snapshot is rewritten only when the journal grows past ``compact_lines`` /
+    ``compact_bytes`` or a write is forced, at which point the journal is
+    truncated. Loading reads the snapshot and replays the journal on top.
+    """
 
-    def save(self) -> None:
-        """Save current checklist state."""
+    def __init__(
+        self,
+        checklist_path: Path | str = "store_parser_checklist.json",
+        batch_size: int = 50,
+        flush_interval: float = 5.0,
+        compact_lines: int = 1000,
+        compact_bytes: int = 1024 * 1024,
+    ):
+        """Initialize manager.
+
+        Args:
+            checklist_path: Path to checklist file (.json, or .yaml for YAML)
+            batch_size: Flush the journal to disk after this many unsaved changes
+            flush_interval: Flush the journal when the last flush is older than this (seconds)
+            compact_lines: Rewrite the snapshot once the journal has this many records
+            compact_bytes: Rewrite the snapshot once the journal reaches this size
+        """
+        self.checklist_path = Path(checklist_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.compact_lines = compact_lines
+        self.compact_bytes = compact_bytes
+        self._journal_path = self.checklist_path.with_suffix(".journal")
+        self._journal: BinaryIO | None = None
+
+        # Bumped on every change; get_summary() is cached against it
+        self._generation = 0
+        self._summary: dict | None = None
+        self._summary_generation = -1
+
+        self._load()
+
+    def _existing_path(self) -> Path:
+        """Path to load from, falling back to a legacy YAML checklist."""
+        legacy_path = self.checklist_path.with_suffix(".yaml")
+        if (
+            self.checklist_path.suffix == ".json"
+            and not self.checklist_path.exists()
+            and legacy_path.exists()
+        ):
+            return legacy_path
+        return self.checklist_path
+
+    def _load(self) -> None:
+        """Load the snapshot and replay the journal on top of it."""
+        self.checklist = StoreParserChecklist.load(self._existing_path())
+        self._jobs_by_id = {job.id: job for job in self.checklist.jobs}
+        self._products_by_id = {product.id: product for product in self.checklist.products}
+        self._errors_by_id = {error.id: error for error in self.checklist.errors}
+        self._journal_lines = 0
+        self._journal_bytes = 0
+        if self._journal_path.exists():
+            with self._journal_path.open("rb") as journal:
+                for line in journal:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn final record from an interrupted write
+                        break
+                    self._apply_record(record["op"], record["data"])
+                    self._journal_lines += 1
+                    self._journal_bytes += len(line)
+            # Replayed upserts replace dict values in place, keeping list order
+            self.checklist.jobs = list(self._jobs_by_id.values())
+            self.checklist.products = list(self._products_by_id.values())
+            self.checklist.errors = list(self._errors_by_id.values())
+
+        # Insertion-ordered id sets backing get_pending_jobs()/get_failed_products()
+        self._pending_jobs = {
+            job.id: None for job in self.checklist.jobs if job.status == JobStatus.PENDING
+        }
+        self._failed_products = {
+            product.id: None
+            for product in self.checklist.products
+            if product.status == JobStatus.FAILED
+        }
+        self._unresolved_errors = sum(1 for error in self.checklist.errors if not error.resolved)
+        stats = self.checklist.stats
+        stats.by_category = defaultdict(int, stats.by_category)
+        session = self.checklist.current_session
+        self._progress = (
+            _ProgressCounters(**session.progress.model_dump()) if session else _ProgressCounters()
+        )
+        self._progress_dirty = False
+        self._dirty = self._journal_lines > 0
+        self._generation += 1
+        self._pending_ops = 0
+        self._last_flush = time.monotonic()
+
+    def __enter__(self) -> "ChecklistManager":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit. Writes any pending changes."""
+        self.flush()
+
+    def save(self, force: bool = False) -> None:
+        """Record that a change was journaled and persist according to the batching policy.
+
+        Args:
+            force: Write the full snapshot immediately
+        """
+        self._dirty = True
+        self._pending_ops += 1
+        self._generation += 1
+        if (
+            force
+            or self._journal_lines >= self.compact_lines
+            or self._journal_bytes >= self.compact_bytes
+        ):
+            self._compact()
+        elif (
+            self._pending_ops >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self._flush()
+
+    def flush(self) -> None:
+        """Write pending changes to the snapshot, if any."""
+        if self._dirty:
+            self._compact()
+
+    def _flush(self) -> None:
+        """Push buffered journal records to disk."""
+        self._sync_progress()
+        if self._journal is not None:
+            self._journal.flush()
+        self._pending_ops = 0
+        self._last_flush = time.monotonic()
+
+    def _compact(self) -> None:
+        """Write the full checklist snapshot and truncate the journal."""
+        self._sync_progress()
         self.checklist.save(self.checklist_path)
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        self._journal_path.unlink(missing_ok=True)
+        self._journal_lines = 0
+        self._journal_bytes = 0
+        self._dirty = False
+        # The snapshot write refreshed updated_at
+        self._generation += 1
+        self._pending_ops = 0
+        self._last_flush = time.monotonic()
+
+    def _record(self, op: str, entry: BaseModel) -> None:
+        """Append a changed entry to the journal."""
+        if self._journal is None:
+            self._journal = self._journal_path.open("ab")
+        # Serialize the entry with pydantic's Rust encoder instead of dict + json.dumps
+        line = b'{"op": "%s", "data": %s}\n' % (
+            op.encode("ascii"),
+            entry.model_dump_json().encode("utf-8"),
+        )
+        self._journal.write(line)
+        self._journal_lines += 1
+        self._journal_bytes += len(line)
+
+    def _apply_record(self, op: str, data: dict) -> None:
+        """Apply a journal record to the in-memory checklist."""
+        if op == "session":
+            self.checklist.current_session = CurrentSession.model_validate(data)
+        elif op == "job":
+            job = CrawlJob.model_validate(data)
+            self._jobs_by_id[job.id] = job
+        elif op == "product":
+            product = ProductEntry.model_validate(data)
+            self._products_by_id[product.id] = product
+        elif op == "error":
+            error = ErrorEntry.model_validate(data)
+            self._errors_by_id[error.id] = error
+        elif op == "stats":
+            self.checklist.stats = Stats.model_validate(data)
+        elif op == "metadata_sync":
+            self.checklist.metadata_sync = MetadataSync.model_validate(data)
 
     def reload(self) -> None:
-        """Reload checklist from file."""
-        self.checklist = StoreParserChecklist.load(self.checklist_path)
+        """Reload checklist from the snapshot and journal."""
+        self._flush()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        self._load()
 
     # =========================================================================
     # Session Management
@@ -52,6 +255,9 @@ class ChecklistManager:
             progress=SessionProgress(),
         )
         self.checklist.current_session = session
+        self._progress = _ProgressCounters()
+        self._progress_dirty = False
+        self._record("session", session)
         self.save()
         return session
 
@@ -65,11 +271,15 @@ class ChecklistManager:
         current_page: int | None = None,
         last_product_url: str | None = None,
     ) -> None:
-        """Update current session progress."""
+        """Update current session progress.
+
+        Counters are kept outside the session model and copied into it when the
+        journal or snapshot is written.
+        """
         if not self.checklist.current_session:
             return
 
-        progress = self.checklist.current_session.progress
+        progress = self._progress
         if products_discovered is not None:
             progress.products_discovered = products_discovered
         if products_crawled is not None:
@@ -85,13 +295,26 @@ class ChecklistManager:
         if last_product_url is not None:
             progress.last_product_url = last_product_url
 
+        self._progress_dirty = True
         self.save()
 
+    def _sync_progress(self) -> None:
+        """Copy pending progress counters into the session model and journal it."""
+        if not self._progress_dirty or not self.checklist.current_session:
+            return
+        self.checklist.current_session.progress = SessionProgress.model_construct(
+            **asdict(self._progress)
+        )
+        self._progress_dirty = False
+        self._record("session", self.checklist.current_session)
+
     def end_session(self, status: JobStatus = JobStatus.COMPLETED) -> None:
         """End current session."""
+        self._sync_progress()
         if self.checklist.current_session:
             self.checklist.current_session.status = status
-        self.save()
+            self._record("session", self.checklist.current_session)
+        self.save(force=True)
 
     # =========================================================================
     # Job Management
@@ -113,8 +336,12 @@ class ChecklistManager:
             config=config or JobConfig(),
         )
         self.checklist.jobs.append(job)
+        self._jobs_by_id[job_id] = job
+        self._pending_jobs[job_id] = None
         self.checklist.stats.jobs.total += 1
         self.checklist.stats.jobs.pending += 1
+        self._record("job", job)
+        self._record("stats", self.checklist.stats)
         self.save()
         return job
 
@@ -125,11 +352,14 @@ class ChecklistManager:
             return None
 
         job.status = JobStatus.IN_PROGRESS
+        self._pending_jobs.pop(job_id, None)
         job.execution.agent = agent
         job.execution.started_at = datetime.now()
 
         if self.checklist.stats.jobs.pending > 0:
             self.checklist.stats.jobs.pending -= 1
+        self._record("job", job)
+        self._record("stats", self.checklist.stats)
         self.save()
         return job
 
@@ -139,11 +369,13 @@ class ChecklistManager:
         if not job:
             return None
 
+        now = datetime.now()
         job.status = JobStatus.COMPLETED if result.success else JobStatus.FAILED
-        job.execution.completed_at = datetime.now()
+        self._pending_jobs.pop(job_id, None)
+        job.execution.completed_at = now
 
         if job.execution.started_at:
-            duration = (job.execution.completed_at - job.execution.started_at).seconds
+            duration = (now - job.execution.started_at).seconds
             job.execution.duration_seconds = duration
 
         job.result = result
@@ -152,25 +384,24 @@ class ChecklistManager:
         if result.success:
             self.checklist.stats.jobs.completed += 1
             if job.type == JobType.FULL_CRAWL:
-                self.checklist.stats.last_full_crawl = datetime.now()
+                self.checklist.stats.last_full_crawl = now
             elif job.type == JobType.INCREMENTAL:
-                self.checklist.stats.last_incremental = datetime.now()
+                self.checklist.stats.last_incremental = now
         else:
             self.checklist.stats.jobs.failed += 1
 
-        self.save()
+        self._record("job", job)
+        self._record("stats", self.checklist.stats)
+        self.save(force=True)
         return job
 
     def _find_job(self, job_id: str) -> CrawlJob | None:
         """Find a job by ID."""
-        for job in self.checklist.jobs:
-            if job.id == job_id:
-                return job
-        return None
+        return self._jobs_by_id.get(job_id)
 
     def get_pending_jobs(self) -> list[CrawlJob]:
         """Get all pending jobs."""
-        return [job for job in self.checklist.jobs if job.status == JobStatus.PENDING]
+        return [self._jobs_by_id[job_id] for job_id in self._pending_jobs]
 
     # =========================================================================
     # Product Tracking
@@ -234,27 +465,30 @@ class ChecklistManager:
                 category=category,
             )
             self.checklist.products.append(product)
-            self.checklist.stats.total_products = len(self.checklist.products)
+            self._products_by_id[product_id] = product
+            self.checklist.stats.total_products += 1
 
             # Update category stats
             if category:
-                if category not in self.checklist.stats.by_category:
-                    self.checklist.stats.by_category[category] = 0
                 self.checklist.stats.by_category[category] += 1
+            self._record("stats", self.checklist.stats)
 
+        if status == JobStatus.FAILED:
+            self._failed_products[product_id] = None
+        else:
+            self._failed_products.pop(product_id, None)
+
+        self._record("product", product)
         self.save()
         return product
 
     def _find_product(self, product_id: str) -> ProductEntry | None:
         """Find a product by ID."""
-        for product in self.checklist.products:
-            if product.id == product_id:
-                return product
-        return None
+        return self._products_by_id.get(product_id)
 
     def get_failed_products(self) -> list[ProductEntry]:
         """Get all products with failed status."""
-        return [p for p in self.checklist.products if p.status == JobStatus.FAILED]
+        return [self._products_by_id[product_id] for product_id in self._failed_products]
 
     # =========================================================================
     # Error Tracking
@@ -279,6 +513,9 @@ class ChecklistManager:
             message=message,
         )
         self.checklist.errors.append(error)
+        self._errors_by_id[error.id] = error
+        self._unresolved_errors += 1
+        self._record("error", error)
         self.save()
         return error
 
@@ -288,12 +525,15 @@ class ChecklistManager:
 
     def resolve_error(self, error_id: str) -> bool:
         """Mark an error as resolved."""
-        for error in self.checklist.errors:
-            if error.id == error_id:
-                error.resolved = True
-                self.save()
-                return True
-        return False
+        error = self._errors_by_id.get(error_id)
+        if not error:
+            return False
+        if not error.resolved:
+            self._unresolved_errors -= 1
+        error.resolved = True
+        self._record("error", error)
+        self.save()
+        return True
 
     # =========================================================================
     # Metadata Sync
@@ -301,7 +541,9 @@ class ChecklistManager:
 
     def sync_from_metadata(self, crawl_result: CrawlResult) -> None:
         """Sync checklist with existing metadata.json."""
-        self.checklist.stats.total_products = crawl_result.total_products
+        # The crawl result may hold only this run's products; the running
+        # counter must keep counting every product the checklist tracks
+        self.checklist.stats.total_products = len(self.checklist.products)
         self.checklist.stats.total_images = crawl_result.total_images
         self.checklist.stats.downloads.successful = crawl_result.total_images
 
@@ -310,6 +552,8 @@ class ChecklistManager:
         self.checklist.metadata_sync.images_in_metadata = crawl_result.total_images
         self.checklist.metadata_sync.sync_status = "in_sync"
 
+        self._record("stats", self.checklist.stats)
+        self._record("metadata_sync", self.checklist.metadata_sync)
         self.save()
 
     # =========================================================================
@@ -317,8 +561,16 @@ class ChecklistManager:
     # =========================================================================
 
     def get_summary(self) -> dict:
-        """Get a summary of the checklist state."""
-        return {
+        """Get a summary of the checklist state.
+
+        The result is cached until the next change and shared between callers,
+        so treat it as read-only.
+        """
+        if self._summary is not None and self._summary_generation == self._generation:
+            return self._summary
+
+        self._sync_progress()
+        self._summary = {
             "project": self.checklist.project,
             "target_site": self.checklist.target_site,
             "updated_at": self.checklist.updated_at.isoformat(),
@@ -343,7 +595,7 @@ class ChecklistManager:
                 "jobs_pending": self.checklist.stats.jobs.pending,
                 "jobs_failed": self.checklist.stats.jobs.failed,
                 "errors_count": len(self.checklist.errors),
-                "unresolved_errors": len(self.get_unresolved_errors()),
+                "unresolved_errors": self._unresolved_errors,
             },
             "metadata_sync": {
                 "status": self.checklist.metadata_sync.sync_status,
@@ -354,6 +606,8 @@ class ChecklistManager:
                 ),
             },
         }
+        self._summary_generation = self._generation
+        return self._summary
 
     def print_status(self) -> str:
         """Get a formatted status string."""
@@ -2,9 +2,14 @@
 
 import asyncio
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 
 from playwright.async_api import Browser, Page, async_playwright
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from ._http import DEFAULT_HEADERS
 
 logger = logging.getLogger(__name__)
 
@@ -14,18 +19,32 @@ class GGStoreCrawler:
 
     BASE_URL = "https://ggstore.com"
     COLLECTION_URL = f"{BASE_URL}/collections/all"
-
-    def __init__(self, headless: bool = True, delay: float = 1.0):
+    MAX_COLLECTION_PAGES = 50
+    PRODUCT_LINK_SELECTOR = 'a[href*="/products/"]'
+    # Shown by the theme instead of the product grid past the last page
+    EMPTY_COLLECTION_SELECTOR = '.collection--empty, main :text-matches("no products", "i")'
+    # How long a collection page may take to show its first product link
+    COLLECTION_TIMEOUT_MS = 10_000
+    # Tries per collection page before discovery fails
+    COLLECTION_ATTEMPTS = 3
+
+    def __init__(self, headless: bool = True, delay: float = 1.0, concurrency: int = 4):
         """Initialize crawler.
 
         Args:
             headless: Run browser in headless mode
-            delay: Delay between requests in seconds
+            delay: Minimum interval between product page requests in seconds
+            concurrency: Number of browser pages used in parallel
         """
         self.headless = headless
         self.delay = delay
+        self.concurrency = max(1, concurrency)
         self._browser: Browser | None = None
         self._page: Page | None = None
+        self._page_pool: asyncio.Queue[Page] = asyncio.Queue()
+        self._pool_size = 0
+        self._rate_lock = asyncio.Lock()
+        self._next_request_at = 0.0
 
     async def __aenter__(self) -> "GGStoreCrawler":
         """Async context manager entry."""
@@ -40,17 +59,16 @@ class GGStoreCrawler:
         """Start the browser."""
         playwright = await async_playwright().start()
         self._browser = await playwright.chromium.launch(headless=self.headless)
-        self._page = await self._browser.new_page()
+        self._page = await self._new_page()
+        logger.info("Browser started")
+
+    async def _new_page(self) -> Page:
+        """Open a browser page with the crawler's request headers."""
+        page = await self._browser.new_page()
 
         # Set user agent to avoid bot detection
-        await self._page.set_extra_http_headers({
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            )
-        })
-        logger.info("Browser started")
+        await page.set_extra_http_headers(DEFAULT_HEADERS)
+        return page
 
     async def close(self) -> None:
         """Close the browser."""
@@ -58,11 +76,35 @@ class GGStoreCrawler:
             await self._browser.close()
             self._browser = None
             self._page = None
+            self._page_pool = asyncio.Queue()
+            self._pool_size = 0
             logger.info("Browser closed")
 
     async def _wait(self) -> None:
-        """Wait between requests."""
-        await asyncio.sleep(self.delay)
+        """Wait for the next product request slot.
+
+        Slots are ``delay`` seconds apart across all concurrent callers, so the
+        request rate to the site stays the same however many pages are open.
+        """
+        async with self._rate_lock:
+            now = asyncio.get_running_loop().time()
+            if self._next_request_at > now:
+                await asyncio.sleep(self._next_request_at - now)
+                now = self._next_request_at
+            self._next_request_at = now + self.delay
+
+    @asynccontextmanager
+    async def _pooled_page(self) -> AsyncIterator[Page]:
+        """Borrow a browser page, opening up to ``concurrency`` pages on demand."""
+        if self._page_pool.empty() and self._pool_size < self.concurrency:
+            self._pool_size += 1
+            page = self._page if self._pool_size == 1 else await self._new_page()
+        else:
+            page = await self._page_pool.get()
+        try:
+            yield page
+        finally:
+            self._page_pool.put_nowait(page)
 
     async def get_product_urls(self) -> list[str]:
         """Get all product URLs from the collection page.
@@ -70,56 +112,183 @@ class GGStoreCrawler:
         Returns:
             List of product URLs
         """
-        if not self._page:
-            raise RuntimeError("Browser not started. Call start() first.")
-
-        product_urls: list[str] = []
-        page_num = 1
+        return [url async for url in self.iter_product_urls()]
 
-        while True:
-            url = f"{self.COLLECTION_URL}?page={page_num}"
-            logger.info(f"Fetching page {page_num}: {url}")
+    async def iter_product_urls(self) -> AsyncIterator[str]:
+        """Yield product URLs from the collection pages as they are fetched.
 
-            await self._page.goto(url, wait_until="networkidle")
-            await self._wait()
+        Collection pages are fetched ``concurrency`` at a time on their own
+        browser pages, and their URLs are yielded in page order with the same
+        stopping rules as a sequential walk. Only this in-order walk decides
+        where pagination ends; the fetchers run at most ``concurrency`` pages
+        ahead of it and are cancelled once it stops. The pooled pages stay
+        free for get_product_html(), so callers can fetch products while
+        pagination is still running.
 
-            # Find product links
-            product_links = await self._page.query_selector_all(
-                'a[href*="/products/"]'
-            )
+        Yields:
+            Product URLs, without duplicates
+        """
+        if not self._page:
+            raise RuntimeError("Browser not started. Call start() first.")
 
-            if not product_links:
-                logger.info(f"No products found on page {page_num}, stopping")
-                break
+        pages = [await self._new_page() for _ in range(self.concurrency)]
+        fetched: asyncio.Queue[tuple[int, list[str] | Exception] | None] = asyncio.Queue()
+        window = asyncio.Semaphore(len(pages))
+        fetch_task = asyncio.create_task(self._fetch_collection_pages(pages, fetched, window))
 
-            page_urls = []
-            for link in product_links:
-                href = await link.get_attribute("href")
-                if href and "/products/" in href:
-                    full_url = href if href.startswith("http") else f"{self.BASE_URL}{href}"
-                    if full_url not in product_urls and full_url not in page_urls:
+        page_results: dict[int, list[str] | Exception] = {}
+        seen: set[str] = set()
+        page_num = 1
+        fetch_done = False
+
+        try:
+            while True:
+                # Wait for the next page in order; later pages may arrive first
+                while page_num not in page_results and not fetch_done:
+                    item = await fetched.get()
+                    if item is None:
+                        fetch_done = True
+                        await fetch_task  # re-raise a failed page fetch
+                    else:
+                        page_results[item[0]] = item[1]
+
+                hrefs = page_results.pop(page_num, None)
+                if isinstance(hrefs, Exception):
+                    raise hrefs
+                if not hrefs:
+                    logger.info("No products found on page %d, stopping", page_num)
+                    break
+
+                page_urls = []
+                for full_url in hrefs:
+                    if full_url not in seen:
+                        seen.add(full_url)
                         page_urls.append(full_url)
 
-            if not page_urls:
-                logger.info("No new products found, stopping pagination")
-                break
-
-            product_urls.extend(page_urls)
-            logger.info(f"Found {len(page_urls)} products on page {page_num}")
-
-            page_num += 1
+                if not page_urls:
+                    logger.info("No new products found, stopping pagination")
+                    break
+
+                # Let the fetchers start one page further ahead
+                window.release()
+                logger.info("Found %d products on page %d", len(page_urls), page_num)
+                for full_url in page_urls:
+                    yield full_url
+
+                page_num += 1
+
+                # Safety limit
+                if page_num > self.MAX_COLLECTION_PAGES:
+                    logger.warning("Reached page limit (%d), stopping", self.MAX_COLLECTION_PAGES)
+                    break
+
+            logger.info("Total products found: %d", len(seen))
+        finally:
+            fetch_task.cancel()
+            await asyncio.gather(fetch_task, return_exceptions=True)
+            for page in pages:
+                await page.close()
+
+    async def _fetch_collection_pages(
+        self,
+        pages: list[Page],
+        fetched: asyncio.Queue[tuple[int, list[str] | Exception] | None],
+        window: asyncio.Semaphore,
+    ) -> None:
+        """Fetch collection pages in parallel, one worker per browser page.
+
+        Workers take page numbers in increasing order, acquiring ``window``
+        before each one; the consumer releases it once per page it accepts, so
+        it alone decides how far pagination goes. Each result is put on
+        ``fetched`` as ``(page_num, urls)`` as soon as it arrives, or
+        ``(page_num, error)`` for a page that failed to load, followed by None
+        once all workers are done.
+        """
+        next_page = 1
+
+        async def worker(page: Page) -> None:
+            nonlocal next_page
+            while True:
+                await window.acquire()
+                if next_page > self.MAX_COLLECTION_PAGES:
+                    window.release()  # let the other workers see the end too
+                    return
+                page_num = next_page
+                next_page += 1
+                try:
+                    hrefs = await self._fetch_collection_page(page, page_num)
+                except (RuntimeError, PlaywrightError) as e:
+                    # Raised by the consumer only if pagination gets this far
+                    fetched.put_nowait((page_num, e))
+                    continue
+                fetched.put_nowait((page_num, hrefs))
+
+        try:
+            await asyncio.gather(*(worker(page) for page in pages))
+        finally:
+            fetched.put_nowait(None)
+
+    async def _fetch_collection_page(self, page: Page, page_num: int) -> list[str]:
+        """Fetch one collection page and return its product URLs in document order.
+
+        A page counts as empty only once it has finished loading without
+        product links. A page that doesn't load is retried, then reported as an
+        error instead of ending pagination.
+        """
+        url = f"{self.COLLECTION_URL}?page={page_num}"
+        logger.info("Fetching page %d: %s", page_num, url)
 
-            # Safety limit
-            if page_num > 50:
-                logger.warning("Reached page limit (50), stopping")
+        for attempt in range(1, self.COLLECTION_ATTEMPTS + 1):
+            try:
+                await self._load_collection_page(page, url)
                 break
-
-        logger.info(f"Total products found: {len(product_urls)}")
-        return product_urls
+            except PlaywrightTimeoutError as e:
+                if attempt == self.COLLECTION_ATTEMPTS:
+                    raise RuntimeError(
+                        f"Collection page {page_num} did not load after {attempt} attempts"
+                    ) from e
+                logger.warning(
+                    "Collection page %d timed out (attempt %d/%d), retrying",
+                    page_num, attempt, self.COLLECTION_ATTEMPTS,
+                )
+
+        # Read every product link's href in one round-trip to the browser
+        hrefs = await page.evaluate(
+            "selector => Array.from("
+            "document.querySelectorAll(selector), a => a.getAttribute('href'))",
+            self.PRODUCT_LINK_SELECTOR,
+        )
+        return [
+            href if href.startswith("http") else f"{self.BASE_URL}{href}"
+            for href in hrefs
+            if href and "/products/" in href
+        ]
+
+    async def _load_collection_page(self, page: Page, url: str) -> None:
+        """Open a collection page and wait until its product grid or empty notice is shown.
+
+        Raises:
+            PlaywrightTimeoutError: If the page doesn't finish loading in time
+        """
+        # Continue as soon as the product grid (or the empty-collection notice)
+        # is in the DOM instead of waiting for the network to go idle
+        await page.goto(url, wait_until="domcontentloaded")
+        try:
+            await page.wait_for_selector(
+                f"{self.PRODUCT_LINK_SELECTOR}, {self.EMPTY_COLLECTION_SELECTOR}",
+                state="attached",
+                timeout=self.COLLECTION_TIMEOUT_MS,
+            )
+        except PlaywrightTimeoutError:
+            # Neither showed up: only trust an empty grid once the page has loaded
+            await page.wait_for_load_state("load", timeout=self.COLLECTION_TIMEOUT_MS)
+            logger.warning("Collection page loaded without products or an empty notice: %s", url)
 
     async def get_product_html(self, url: str) -> str:
         """Get HTML content of a product page.
 
+        Safe to call concurrently; each call uses its own pooled browser page.
+
         Args:
             url: Product page URL
 
@@ -129,11 +298,11 @@ class GGStoreCrawler:
         if not self._page:
             raise RuntimeError("Browser not started. Call start() first.")
 
-        logger.debug(f"Fetching product: {url}")
-        await self._page.goto(url, wait_until="networkidle")
-        await self._wait()
-
-        return await self._page.content()
+        async with self._pooled_page() as page:
+            await self._wait()
+            logger.debug("Fetching product: %s", url)
+            await page.goto(url, wait_until="networkidle")
+            return await page.content()
 
     async def crawl_products(self) -> AsyncGenerator[tuple[str, str], None]:
         """Crawl all products and yield URL and HTML.
@@ -143,11 +312,12 @@ class GGStoreCrawler:
         """
         product_urls = await self.get_product_urls()
 
+        total = len(product_urls)
         for i, url in enumerate(product_urls, 1):
-            logger.info(f"Processing product {i}/{len(product_urls)}: {url}")
+            logger.info("Processing product %d/%d: %s", i, total, url)
             try:
                 html = await self.get_product_html(url)
                 yield url, html
             except Exception as e:
-                logger.error(f"Failed to fetch {url}: {e}")
+                logger.error("Failed to fetch %s: %s", url, e)
                 continue
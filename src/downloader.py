@@ -1,27 +1,61 @@
 """Image downloader for GGStore products."""
 
 import asyncio
-import json
+import hashlib
+import importlib.util
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import BinaryIO
 
 import httpx
+from pydantic import TypeAdapter
 
-from .models import CrawlResult, ProductImage
+from ._files import read_bytes, write_bytes
+from ._http import DEFAULT_HEADERS
+from .models import CrawlResult, Product, ProductImage
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Image extensions kept as-is in local filenames; anything else is saved as .jpg
+IMAGE_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "webp", "gif"})
+
+# Bytes read from the response per write when streaming an image to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Serialize straight to UTF-8 bytes; model_dump_json returns str, which would
+# be encoded again before writing
+_CRAWL_RESULT_JSON = TypeAdapter(CrawlResult)
+_PRODUCT_JSON = TypeAdapter(Product)
+
 
 class ImageDownloader:
-    """Async image downloader with metadata tracking."""
+    """Async image downloader with metadata tracking.
+
+    Downloads go through one queue served by ``max_concurrent`` worker tasks
+    sharing a single pooled client, so images from different products (and
+    concurrent callers) reuse the same connections to the CDN.
+
+    Downloaded files are identified by the SHA-256 of their content; an image
+    whose bytes match an earlier download is hard-linked to that file instead
+    of being stored again.
+
+    Products finished since the last save_metadata() are appended to a JSON
+    Lines journal next to the metadata file (``<name>.journal``), so a crawl
+    records progress without rewriting the whole metadata file. Loading merges
+    the journal into the metadata; saving the metadata removes it.
+    """
 
     def __init__(
         self,
         output_dir: Path | str = "data/images",
         metadata_file: Path | str = "data/metadata.json",
         max_concurrent: int = 5,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         """Initialize downloader.
 
@@ -29,12 +63,23 @@ class ImageDownloader:
             output_dir: Directory to save images
             metadata_file: Path to metadata JSON file
             max_concurrent: Max concurrent downloads
+            transport: Optional httpx transport for the client (e.g. a mock in tests)
         """
         self.output_dir = Path(output_dir)
         self.metadata_file = Path(metadata_file)
         self.max_concurrent = max_concurrent
-        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._transport = transport
+        self._journal_path = self.metadata_file.with_suffix(".journal")
+        self._journal: BinaryIO | None = None
         self._client: httpx.AsyncClient | None = None
+        self._queue: asyncio.Queue[
+            tuple[str, Path, ProductImage | None, asyncio.Future[ProductImage | None]]
+        ] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+        self._hash_to_path: dict[str, Path] = {}
+        self._path_to_hash: dict[Path, str] = {}
+        self._known_images: dict[str, ProductImage] = {}
+        self._downloaded_ids: set[str] | None = None
 
         # Ensure directories exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -45,22 +90,35 @@ class ImageDownloader:
         self._client = httpx.AsyncClient(
             timeout=30.0,
             follow_redirects=True,
-            headers={
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                )
-            },
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=self.max_concurrent,
+                max_connections=self.max_concurrent * 2,
+            ),
+            headers=DEFAULT_HEADERS,
+            transport=self._transport,
         )
+        # Load earlier metadata up front, whether or not existing products are
+        # skipped, so known images are revalidated and identical content linked
+        self.get_downloaded_product_ids()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Async context manager exit."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        while not self._queue.empty():
+            *_, future = self._queue.get_nowait()
+            future.cancel()
+
         if self._client:
             await self._client.aclose()
             self._client = None
 
+        self._close_journal()
+
     def _get_filename(self, product_id: str, index: int, url: str) -> str:
         """Generate filename for image.
 
@@ -72,39 +130,153 @@ class ImageDownloader:
         Returns:
             Filename with extension
         """
-        # Extract extension from URL
-        path = urlparse(url).path
-        ext = Path(path).suffix.lower()
-        if not ext or ext not in ('.jpg', '.jpeg', '.png', '.webp', '.gif'):
-            ext = '.jpg'
-
-        return f"{product_id}_{index:02d}{ext}"
-
-    async def download_image(self, url: str, filepath: Path) -> bool:
-        """Download a single image.
+        # Extract extension from the URL path (before any query or fragment)
+        end = len(url)
+        for sep in ("?", "#"):
+            pos = url.find(sep, 0, end)
+            if pos != -1:
+                end = pos
+        dot = url.rfind(".", 0, end)
+        ext = url[dot + 1 : end].lower() if dot != -1 else ""
+        if ext not in IMAGE_EXTENSIONS:
+            ext = "jpg"
+
+        return f"{product_id}_{index:02d}.{ext}"
+
+    def enqueue(
+        self, url: str, filepath: Path, cached: ProductImage | None = None
+    ) -> asyncio.Future[ProductImage | None]:
+        """Queue an image download.
 
         Args:
             url: Image URL
             filepath: Destination file path
+            cached: Earlier record of this image; its validators make the request
+                conditional and it is returned as-is when the server answers 304
 
         Returns:
-            True if successful
+            Future resolving to the downloaded image, or None if the download failed
         """
         if not self._client:
             raise RuntimeError("Downloader not started. Use async context manager.")
 
-        async with self._semaphore:
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self.max_concurrent)
+            ]
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((url, filepath, cached, future))
+        return future
+
+    async def _worker(self) -> None:
+        """Serve queued downloads until cancelled."""
+        while True:
+            url, filepath, cached, future = await self._queue.get()
             try:
-                response = await self._client.get(url)
+                if not future.done():
+                    future.set_result(await self._fetch(url, filepath, cached))
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    async def _fetch(
+        self, url: str, filepath: Path, cached: ProductImage | None = None
+    ) -> ProductImage | None:
+        """Fetch one image with the shared client, streaming the body to disk.
+
+        Returns:
+            The downloaded image (``cached`` if unchanged), or None on HTTP errors
+        """
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        # Stream into a temporary file so a partial image never sits at filepath
+        part_path = filepath.with_name(filepath.name + ".part")
+        digest = hashlib.sha256()
+        try:
+            async with self._client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304 and cached is not None:
+                    logger.debug("Not modified: %s", filepath.name)
+                    return cached
                 response.raise_for_status()
+                with part_path.open("wb") as f:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        digest.update(chunk)
+                        f.write(chunk)
+        except httpx.HTTPError as e:
+            logger.error("Failed to download %s: %s", url, e)
+            part_path.unlink(missing_ok=True)
+            return None
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+
+        sha256 = digest.hexdigest()
+        self._store(part_path, filepath, sha256)
+        logger.debug("Downloaded: %s", filepath.name)
+        # Fields are built here, so skip pydantic validation
+        return ProductImage.model_construct(
+            filename=filepath.name,
+            original_url=url,
+            local_path=str(filepath),
+            downloaded_at=datetime.now(),
+            sha256=sha256,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def _store(self, part_path: Path, filepath: Path, sha256: str) -> None:
+        """Move a finished download into place, linking to an identical image if known."""
+        # filepath's old contents are about to be replaced, so it no longer backs their hash
+        self._forget_path(filepath)
+        existing = self._hash_to_path.get(sha256)
+        if existing is not None and existing.exists():
+            try:
+                filepath.unlink(missing_ok=True)
+                os.link(existing, filepath)
+            except OSError:
+                # Hard links unsupported here (e.g. FAT/exFAT or another volume)
+                pass
+            else:
+                part_path.unlink()
+                logger.debug("Linked duplicate %s -> %s", filepath.name, existing.name)
+                return
+
+        os.replace(part_path, filepath)
+        self._remember_hash(sha256, filepath)
+
+    def _remember_hash(self, sha256: str, filepath: Path) -> None:
+        """Record filepath as the stored copy of sha256 unless another copy is known."""
+        if self._hash_to_path.setdefault(sha256, filepath) == filepath:
+            self._path_to_hash[filepath] = sha256
+
+    def _forget_path(self, filepath: Path) -> None:
+        """Drop the hash entry backed by filepath, if any."""
+        sha256 = self._path_to_hash.pop(filepath, None)
+        if sha256 is not None:
+            del self._hash_to_path[sha256]
+
+    async def download_image(self, url: str, filepath: Path) -> bool:
+        """Download a single image.
 
-                filepath.write_bytes(response.content)
-                logger.debug(f"Downloaded: {filepath.name}")
-                return True
+        Args:
+            url: Image URL
+            filepath: Destination file path
 
-            except httpx.HTTPError as e:
-                logger.error(f"Failed to download {url}: {e}")
-                return False
+        Returns:
+            True if successful
+        """
+        return await self.enqueue(url, filepath) is not None
 
     async def download_product_images(
         self,
@@ -113,6 +285,9 @@ class ImageDownloader:
     ) -> list[ProductImage]:
         """Download all images for a product.
 
+        Existing files with a recorded ETag/Last-Modified are revalidated with a
+        conditional GET; existing files without one are skipped.
+
         Args:
             product_id: Product identifier
             image_urls: List of image URLs
@@ -122,73 +297,149 @@ class ImageDownloader:
         """
         images: list[ProductImage] = []
         tasks = []
+        # Existing files found in this call share one timestamp
+        now = datetime.now()
 
         for i, url in enumerate(image_urls, 1):
             filename = self._get_filename(product_id, i, url)
             filepath = self.output_dir / filename
+            cached = None
 
-            # Skip if already downloaded
             if filepath.exists():
-                logger.debug(f"Skipping existing: {filename}")
-                images.append(ProductImage(
-                    filename=filename,
-                    original_url=url,
-                    local_path=str(filepath),
-                    downloaded_at=datetime.now(),
-                ))
+                cached = self._known_images.get(str(filepath))
+                if cached is not None and cached.original_url != url:
+                    cached = None
+
+                # Skip if already downloaded and there is nothing to revalidate
+                if cached is None or not (cached.etag or cached.last_modified):
+                    logger.debug("Skipping existing: %s", filename)
+                    if cached is None:
+                        cached = ProductImage.model_construct(
+                            filename=filename,
+                            original_url=url,
+                            local_path=str(filepath),
+                            downloaded_at=now,
+                        )
+                    images.append(cached)
+                    continue
+
+            tasks.append((url, filepath, cached))
+
+        # Download new images through the shared worker queue
+        results = await asyncio.gather(
+            *(self.enqueue(url, filepath, cached) for url, filepath, cached in tasks),
+            return_exceptions=True,
+        )
+        for (url, _, _), image in zip(tasks, results, strict=True):
+            if isinstance(image, BaseException):
+                logger.error("Failed to download %s: %s", url, image)
                 continue
+            if image is not None:
+                self._known_images[image.local_path] = image
+                images.append(image)
 
-            tasks.append((url, filepath, filename))
+        return images
 
-        # Download new images
-        for url, filepath, filename in tasks:
-            success = await self.download_image(url, filepath)
-            if success:
-                images.append(ProductImage(
-                    filename=filename,
-                    original_url=url,
-                    local_path=str(filepath),
-                    downloaded_at=datetime.now(),
-                ))
+    def append_product(self, product: Product) -> None:
+        """Record a crawled product without rewriting the metadata file.
 
-        return images
+        The product is appended to the metadata journal and included the next
+        time the metadata is loaded, until save_metadata() writes it out.
+
+        Args:
+            product: Crawled product
+        """
+        if self._journal is None:
+            self._journal = self._journal_path.open("ab")
+        self._journal.write(_PRODUCT_JSON.dump_json(product) + b"\n")
+        # One line per product; flush so an interrupted crawl keeps it
+        self._journal.flush()
+        if self._downloaded_ids is not None:
+            self._downloaded_ids.add(product.id)
+
+    def _close_journal(self) -> None:
+        """Close the metadata journal if it is open."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _read_journal(self) -> list[Product]:
+        """Read products appended since the last metadata save."""
+        products: list[Product] = []
+        if not self._journal_path.exists():
+            return products
+
+        with self._journal_path.open("rb") as journal:
+            for line in journal:
+                try:
+                    products.append(Product.model_validate_json(line))
+                except ValueError:
+                    # Torn final line from an interrupted write
+                    break
+        return products
 
     def load_metadata(self) -> CrawlResult | None:
-        """Load existing metadata from file.
+        """Load existing metadata from file, including journaled products.
 
         Returns:
             CrawlResult or None if not exists
         """
-        if not self.metadata_file.exists():
+        result = None
+        if self.metadata_file.exists():
+            try:
+                result = CrawlResult.model_validate_json(read_bytes(self.metadata_file))
+            except Exception as e:
+                logger.error("Failed to load metadata: %s", e)
+                return None
+
+        journaled = self._read_journal()
+        if journaled:
+            # Journaled products replace older entries with the same id
+            products = {p.id: p for p in result.products} if result else {}
+            products.update((p.id, p) for p in journaled)
+            result = CrawlResult(
+                products=list(products.values()),
+                crawled_at=result.crawled_at if result else journaled[0].crawled_at,
+                total_products=len(products),
+                total_images=sum(len(p.images) for p in products.values()),
+            )
+        if result is None:
             return None
 
-        try:
-            data = json.loads(self.metadata_file.read_text(encoding='utf-8'))
-            return CrawlResult.model_validate(data)
-        except Exception as e:
-            logger.error(f"Failed to load metadata: {e}")
-            return None
+        # Remember known images for revalidation and hashes so duplicates can be linked
+        for product in result.products:
+            for image in product.images:
+                self._known_images[image.local_path] = image
+                if image.sha256:
+                    self._remember_hash(image.sha256, Path(image.local_path))
+        return result
+
+    def save_metadata(self, result: CrawlResult, fsync: bool = False) -> None:
+        """Save metadata to file and clear the journal.
 
-    def save_metadata(self, result: CrawlResult) -> None:
-        """Save metadata to file.
+        A ``.gz`` or ``.zst`` suffix on the metadata path selects compression.
 
         Args:
             result: CrawlResult to save
+            fsync: Force the file to disk before it replaces the old one
         """
-        data = result.model_dump(mode='json')
-        self.metadata_file.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False),
-            encoding='utf-8'
-        )
-        logger.info(f"Metadata saved: {self.metadata_file}")
+        # pydantic's Rust serializer; same output as json.dumps(indent=2, ensure_ascii=False)
+        write_bytes(self.metadata_file, _CRAWL_RESULT_JSON.dump_json(result, indent=2), fsync=fsync)
+        self._close_journal()
+        self._journal_path.unlink(missing_ok=True)
+        self._downloaded_ids = {p.id for p in result.products}
+        logger.info("Metadata saved: %s", self.metadata_file)
 
     def get_downloaded_product_ids(self) -> set[str]:
         """Get set of already downloaded product IDs.
 
+        The metadata file is read once; later calls return the same set, which
+        append_product() and save_metadata() keep current. Don't modify it.
+
         Returns:
             Set of product IDs
         """
-        metadata = self.load_metadata()
-        if metadata:
-            return {p.id for p in metadata.products}
-        return set()
+        if self._downloaded_ids is None:
+            metadata = self.load_metadata()
+            self._downloaded_ids = {p.id for p in metadata.products} if metadata else set()
+        return self._downloaded_ids
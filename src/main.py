@@ -3,7 +3,10 @@
 import argparse
 import asyncio
 import logging
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 from .checklist import ErrorType, JobConfig, JobResult, JobStatus, JobType
@@ -13,6 +16,11 @@ from .downloader import ImageDownloader
 from .models import CrawlResult, Product
 from .parser import GGStoreParser
 
+try:
+    import uvloop
+except ImportError:  # optional: pip install "ggp-store-parser[uvloop]" (not on Windows)
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,24 +31,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Discovered products waiting for a worker; pagination pauses when it is full
+PRODUCT_QUEUE_SIZE = 128
+
 
 async def run_crawler(
     output_dir: str = "data/images",
     metadata_file: str = "data/metadata.json",
-    checklist_file: str = "store_parser_checklist.yaml",
+    checklist_file: str = "store_parser_checklist.json",
     headless: bool = True,
     delay: float = 1.5,
     skip_existing: bool = True,
+    concurrency: int = 4,
 ) -> CrawlResult:
     """Run the GGStore image crawler with checklist tracking.
 
     Args:
         output_dir: Directory to save images
         metadata_file: Path to metadata JSON file
-        checklist_file: Path to checklist YAML file
+        checklist_file: Path to checklist JSON file
         headless: Run browser in headless mode
-        delay: Delay between requests in seconds
+        delay: Minimum interval between product page requests in seconds
         skip_existing: Skip already downloaded products
+        concurrency: Number of products processed in parallel
 
     Returns:
         CrawlResult with all crawled data
@@ -67,41 +80,40 @@ async def run_crawler(
     skipped_count = 0
     crawled_count = 0
 
+    # Product pages are parsed in worker processes so regex work on large pages
+    # doesn't hold up fetches and downloads running on the event loop
+    loop = asyncio.get_running_loop()
+    parse_pool = ProcessPoolExecutor(
+        max_workers=max(1, min(concurrency, (os.cpu_count() or 2) - 1)),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
     try:
         async with ImageDownloader(output_dir, metadata_file) as downloader:
-            # Get already downloaded products
-            existing_ids = downloader.get_downloaded_product_ids() if skip_existing else set()
+            # Snapshot already downloaded products; ids are interned like the
+            # parser's, so most membership checks compare by identity
+            existing_ids = (
+                frozenset(map(sys.intern, downloader.get_downloaded_product_ids()))
+                if skip_existing
+                else frozenset()
+            )
             if existing_ids:
-                logger.info(f"Found {len(existing_ids)} already downloaded products")
-
-            async with GGStoreCrawler(headless=headless, delay=delay) as crawler:
-                # Get all product URLs
-                product_urls = await crawler.get_product_urls()
-                logger.info(f"Found {len(product_urls)} products to process")
-
-                # Update checklist with discovered products
-                checklist_mgr.update_session_progress(products_discovered=len(product_urls))
-
-                # Process each product
-                for i, url in enumerate(product_urls, 1):
-                    product_id = parser._extract_product_id(url)
-
-                    # Skip if already downloaded
-                    if product_id in existing_ids:
-                        logger.info(f"[{i}/{len(product_urls)}] Skipping existing: {product_id}")
-                        skipped_count += 1
-                        checklist_mgr.update_session_progress(
-                            products_skipped=skipped_count,
-                            last_product_url=url,
-                        )
-                        continue
+                logger.info("Found %d already downloaded products", len(existing_ids))
 
-                    logger.info(f"[{i}/{len(product_urls)}] Processing: {product_id}")
+            async with GGStoreCrawler(
+                headless=headless, delay=delay, concurrency=concurrency
+            ) as crawler:
+                async def process_product(i: int, url: str, product_id: str) -> None:
+                    nonlocal crawled_count
 
                     try:
+                        logger.info("[%d] Processing: %s", i, product_id)
+
                         # Fetch and parse product page
                         html = await crawler.get_product_html(url)
-                        product_data = parser.parse_product(html, url)
+                        product_data = await loop.run_in_executor(
+                            parse_pool, parser.parse_product, html, url
+                        )
 
                         # Download images
                         images = await downloader.download_product_images(
@@ -109,8 +121,8 @@ async def run_crawler(
                             image_urls=product_data["image_urls"],
                         )
 
-                        # Create product record
-                        product = Product(
+                        # Create product record (parser output is trusted, so skip validation)
+                        product = Product.model_construct(
                             id=product_data["id"],
                             name=product_data["name"],
                             url=product_data["url"],
@@ -120,6 +132,7 @@ async def run_crawler(
                             crawled_at=datetime.now(),
                         )
                         result.add_product(product)
+                        downloader.append_product(product)
                         crawled_count += 1
 
                         # Track product in checklist
@@ -143,16 +156,10 @@ async def run_crawler(
                             last_product_url=url,
                         )
 
-                        logger.info(
-                            f"  Downloaded {len(images)} images for '{product.name}'"
-                        )
-
-                        # Save metadata periodically
-                        if i % 10 == 0:
-                            downloader.save_metadata(result)
+                        logger.info("  Downloaded %d images for '%s'", len(images), product.name)
 
                     except Exception as e:
-                        logger.error(f"Failed to process {url}: {e}")
+                        logger.error("Failed to process %s: %s", url, e)
                         # Log error to checklist
                         checklist_mgr.log_error(
                             job_id=job.id,
@@ -161,7 +168,49 @@ async def run_crawler(
                             product_id=product_id,
                             url=url,
                         )
-                        continue
+
+                # Products are processed by ``concurrency`` workers while pagination
+                # is still running; checklist/result updates run between awaits on
+                # the event loop, so they need no locking
+                queue: asyncio.Queue[tuple[int, str, str] | None] = asyncio.Queue(
+                    maxsize=PRODUCT_QUEUE_SIZE
+                )
+
+                async def worker() -> None:
+                    while (item := await queue.get()) is not None:
+                        # Keep consuming whatever happens, or the producer would
+                        # block forever on a full queue
+                        try:
+                            await process_product(*item)
+                        except Exception:
+                            logger.exception("Worker failed on %s", item[1])
+
+                workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+                try:
+                    discovered = 0
+                    async for url in crawler.iter_product_urls():
+                        discovered += 1
+                        product_id = parser._extract_product_id(url)
+                        if product_id in existing_ids:
+                            logger.debug("[%d] Skipping existing: %s", discovered, product_id)
+                            skipped_count += 1
+                        else:
+                            await queue.put((discovered, url, product_id))
+
+                    logger.info(
+                        "Found %d products, %d already downloaded", discovered, skipped_count
+                    )
+                    checklist_mgr.update_session_progress(
+                        products_discovered=discovered, products_skipped=skipped_count
+                    )
+
+                    for _ in workers:
+                        await queue.put(None)
+                    await asyncio.gather(*workers)
+                finally:
+                    for task in workers:
+                        task.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
 
                 # Final save
                 downloader.save_metadata(result)
@@ -188,8 +237,14 @@ async def run_crawler(
         checklist_mgr.complete_job(job.id, job_result)
         checklist_mgr.end_session(JobStatus.FAILED)
         raise
+    finally:
+        parse_pool.shutdown(wait=False, cancel_futures=True)
+        # Persist batched checklist changes even on interruption
+        checklist_mgr.flush()
 
-    logger.info(f"Crawl complete: {result.total_products} products, {result.total_images} images")
+    logger.info(
+        "Crawl complete: %d products, %d images", result.total_products, result.total_images
+    )
     return result
 
 
@@ -244,12 +299,12 @@ def main() -> int:
     crawl_parser.add_argument(
         "-m", "--metadata",
         default="data/metadata.json",
-        help="Metadata file path (default: data/metadata.json)"
+        help="Metadata file path; .gz/.zst compresses it (default: data/metadata.json)"
     )
     crawl_parser.add_argument(
         "-c", "--checklist",
-        default="store_parser_checklist.yaml",
-        help="Checklist file path (default: store_parser_checklist.yaml)"
+        default="store_parser_checklist.json",
+        help="Checklist file path; .gz/.zst compresses it (default: store_parser_checklist.json)"
     )
     crawl_parser.add_argument(
         "--no-headless",
@@ -260,7 +315,13 @@ def main() -> int:
         "-d", "--delay",
         type=float,
         default=1.5,
-        help="Delay between requests in seconds (default: 1.5)"
+        help="Minimum interval between product page requests in seconds (default: 1.5)"
+    )
+    crawl_parser.add_argument(
+        "-j", "--concurrency",
+        type=int,
+        default=4,
+        help="Number of products processed in parallel (default: 4)"
     )
     crawl_parser.add_argument(
         "--no-skip",
@@ -277,7 +338,7 @@ def main() -> int:
     status_parser = subparsers.add_parser("status", help="Show checklist status")
     status_parser.add_argument(
         "-c", "--checklist",
-        default="store_parser_checklist.yaml",
+        default="store_parser_checklist.json",
         help="Checklist file path"
     )
 
@@ -285,7 +346,7 @@ def main() -> int:
     errors_parser = subparsers.add_parser("errors", help="Show error log")
     errors_parser.add_argument(
         "-c", "--checklist",
-        default="store_parser_checklist.yaml",
+        default="store_parser_checklist.json",
         help="Checklist file path"
     )
     errors_parser.add_argument(
@@ -323,7 +384,8 @@ def main() -> int:
                 headless=not args.no_headless,
                 delay=args.delay,
                 skip_existing=not args.no_skip,
-            ))
+                concurrency=args.concurrency,
+            ), loop_factory=uvloop.new_event_loop if uvloop else None)
 
             print(f"\n{'='*50}")
             print("Crawl Complete!")
@@ -341,7 +403,7 @@ def main() -> int:
             logger.info("Crawl interrupted by user")
             return 1
         except Exception as e:
-            logger.error(f"Crawl failed: {e}")
+            logger.error("Crawl failed: %s", e)
             return 1
 
     return 0
@@ -12,6 +12,9 @@ class ProductImage(BaseModel):
     original_url: str = Field(description="Original CDN URL")
     local_path: str = Field(description="Local file path")
     downloaded_at: datetime = Field(default_factory=datetime.now)
+    sha256: str | None = Field(default=None, description="SHA-256 of the image content")
+    etag: str | None = Field(default=None, description="ETag returned by the CDN")
+    last_modified: str | None = Field(default=None, description="Last-Modified returned by the CDN")
 
 
 class Product(BaseModel):
@@ -37,5 +40,5 @@ class CrawlResult(BaseModel):
     def add_product(self, product: Product) -> None:
         """Add a product and update counts."""
         self.products.append(product)
-        self.total_products = len(self.products)
-        self.total_images = sum(len(p.images) for p in self.products)
+        self.total_products += 1
+        self.total_images += len(product.images)
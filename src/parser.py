@@ -3,6 +3,7 @@
 import html
 import logging
 import re
+import sys
 from urllib.parse import urljoin, urlparse
 
 logger = logging.getLogger(__name__)
@@ -13,6 +14,38 @@ class GGStoreParser:
 
     CDN_PATTERN = re.compile(r'//ggstore\.com/cdn/shop/')
     IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+    IMAGE_EXTENSION_PATTERN = re.compile(
+        '|'.join(re.escape(ext) for ext in IMAGE_EXTENSIONS), re.IGNORECASE
+    )
+
+    # Precompiled patterns used on every product page
+    OG_TITLE_PATTERN = re.compile(
+        r'<meta[^>]*property=["\']og:title["\'][^>]*content=["\']([^"\']+)["\']',
+        re.IGNORECASE
+    )
+    TITLE_PATTERN = re.compile(r'<title>([^<]+)</title>', re.IGNORECASE)
+    H1_PATTERN = re.compile(r'<h1[^>]*>([^<]+)</h1>', re.IGNORECASE)
+    PRICE_PATTERNS = (
+        re.compile(
+            r'<span[^>]*class=["\'][^"\']*price[^"\']*["\'][^>]*>\s*\$?([\d,.]+)',
+            re.IGNORECASE
+        ),
+        re.compile(r'"price":\s*"?\$?([\d,.]+)', re.IGNORECASE),
+        re.compile(r'data-price=["\'](\d+)', re.IGNORECASE),
+    )
+    # First /products/<id> path segment of a plain http(s) URL
+    PRODUCT_ID_PATTERN = re.compile(
+        r'https?://[^/?#\s\[\]]*/(?:[^/?#;\s]+/)*?products/([^/?#;\s]+)(?:[/?#]|$)'
+    )
+    COLLECTION_PATTERN = re.compile(r'/collections/([^/"\'?\s]+)')
+    # srcset / data-src / src attributes and JSON "src" values, matched in one scan
+    IMAGE_URL_PATTERN = re.compile(
+        r'srcset=["\']([^"\']+)["\']'
+        r'|data-src=["\']([^"\']+)["\']'
+        r'|src=["\']([^"\']+(?:cdn/shop/(?:files|products)/)[^"\']+)["\']'
+        r'|"src":\s*"([^"]+cdn/shop/[^"]+)"',
+        re.IGNORECASE
+    )
 
     def __init__(self, base_url: str = "https://ggstore.com"):
         """Initialize parser.
@@ -47,25 +80,32 @@ class GGStoreParser:
             "image_urls": image_urls,
         }
 
-    def _extract_product_id(self, url: str) -> str:
+    @classmethod
+    def _extract_product_id(cls, url: str) -> str:
         """Extract product ID from URL.
 
         Args:
             url: Product URL
 
         Returns:
-            Product ID
+            Product ID (interned; ids are compared against large id sets)
         """
         # URL format: /products/product-name
+        match = cls.PRODUCT_ID_PATTERN.match(url)
+        if match:
+            return sys.intern(match.group(1))
+
+        # Anything unusual (empty segments, ;params, odd schemes) goes through urlparse
         path = urlparse(url).path
         parts = path.strip('/').split('/')
         if 'products' in parts:
             idx = parts.index('products')
             if idx + 1 < len(parts):
-                return parts[idx + 1]
-        return path.strip('/').replace('/', '-')
+                return sys.intern(parts[idx + 1])
+        return sys.intern(path.strip('/').replace('/', '-'))
 
-    def _extract_product_name(self, html: str) -> str:
+    @classmethod
+    def _extract_product_name(cls, html: str) -> str:
         """Extract product name from HTML.
 
         Args:
@@ -75,16 +115,12 @@ class GGStoreParser:
             Product name
         """
         # Try meta og:title first
-        og_title_match = re.search(
-            r'<meta[^>]*property=["\']og:title["\'][^>]*content=["\']([^"\']+)["\']',
-            html,
-            re.IGNORECASE
-        )
+        og_title_match = cls.OG_TITLE_PATTERN.search(html)
         if og_title_match:
             return og_title_match.group(1).strip()
 
         # Try title tag
-        title_match = re.search(r'<title>([^<]+)</title>', html, re.IGNORECASE)
+        title_match = cls.TITLE_PATTERN.search(html)
         if title_match:
             title = title_match.group(1).strip()
             # Remove site name suffix
@@ -95,13 +131,14 @@ class GGStoreParser:
             return title
 
         # Try h1 tag
-        h1_match = re.search(r'<h1[^>]*>([^<]+)</h1>', html, re.IGNORECASE)
+        h1_match = cls.H1_PATTERN.search(html)
         if h1_match:
             return h1_match.group(1).strip()
 
         return "Unknown Product"
 
-    def _extract_price(self, html: str) -> str | None:
+    @classmethod
+    def _extract_price(cls, html: str) -> str | None:
         """Extract product price from HTML.
 
         Args:
@@ -111,14 +148,8 @@ class GGStoreParser:
             Price string or None
         """
         # Look for price patterns
-        price_patterns = [
-            r'<span[^>]*class=["\'][^"\']*price[^"\']*["\'][^>]*>\s*\$?([\d,.]+)',
-            r'"price":\s*"?\$?([\d,.]+)',
-            r'data-price=["\'](\d+)',
-        ]
-
-        for pattern in price_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        for pattern in cls.PRICE_PATTERNS:
+            match = pattern.search(html)
             if match:
                 price = match.group(1).strip()
                 if price:
@@ -126,7 +157,8 @@ class GGStoreParser:
 
         return None
 
-    def _extract_category(self, html: str) -> str | None:
+    @classmethod
+    def _extract_category(cls, html: str) -> str | None:
         """Extract product category from HTML.
 
         Args:
@@ -136,10 +168,7 @@ class GGStoreParser:
             Category name or None
         """
         # Look for breadcrumb or collection links
-        breadcrumb_match = re.search(
-            r'/collections/([^/"\'?\s]+)',
-            html
-        )
+        breadcrumb_match = cls.COLLECTION_PATTERN.search(html)
         if breadcrumb_match:
             category = breadcrumb_match.group(1)
             if category.lower() != 'all':
@@ -157,53 +186,42 @@ class GGStoreParser:
             List of image URLs (high resolution)
         """
         image_urls: set[str] = set()
-
-        # Pattern 1: srcset attributes (Shopify lazy loading)
-        srcset_pattern = re.compile(
-            r'srcset=["\']([^"\']+)["\']',
-            re.IGNORECASE
-        )
-        for match in srcset_pattern.finditer(html):
-            srcset = match.group(1)
-            for src in srcset.split(','):
-                url = src.strip().split()[0]
+        # Pages repeat the same URL across srcset widths, src, data-src and JSON;
+        # each raw URL is validated and normalized only once
+        seen: set[str] = set()
+        # Query-less bases of accepted URLs: other widths/versions of an image
+        # differ only in the query, which normalization drops anyway
+        accepted_bases: set[str] = set()
+
+        for srcset, data_src, src, json_src in self.IMAGE_URL_PATTERN.findall(html):
+            if srcset:
+                # srcset attributes (Shopify lazy loading)
+                candidates = [s.strip().split()[0] for s in srcset.split(',')]
+            elif json_src:
+                # JSON data
+                candidates = [json_src.replace('\\/', '/')]
+            else:
+                # data-src (lazy loading) and src attributes
+                candidates = [data_src or src]
+
+            for url in candidates:
+                if url in seen:
+                    continue
+                seen.add(url)
+                # A fragment survives normalization, so only fragment-free URLs collapse
+                base = url.partition('?')[0] if '#' not in url else None
+                if base in accepted_bases:
+                    continue
                 if self._is_product_image(url):
                     image_urls.add(self._normalize_url(url))
+                    if base is not None:
+                        accepted_bases.add(base)
 
-        # Pattern 2: src attributes
-        src_pattern = re.compile(
-            r'src=["\']([^"\']+(?:cdn/shop/(?:files|products)/)[^"\']+)["\']',
-            re.IGNORECASE
-        )
-        for match in src_pattern.finditer(html):
-            url = match.group(1)
-            if self._is_product_image(url):
-                image_urls.add(self._normalize_url(url))
-
-        # Pattern 3: data-src attributes (lazy loading)
-        data_src_pattern = re.compile(
-            r'data-src=["\']([^"\']+)["\']',
-            re.IGNORECASE
-        )
-        for match in data_src_pattern.finditer(html):
-            url = match.group(1)
-            if self._is_product_image(url):
-                image_urls.add(self._normalize_url(url))
-
-        # Pattern 4: JSON data
-        json_pattern = re.compile(
-            r'"src":\s*"([^"]+cdn/shop/[^"]+)"',
-            re.IGNORECASE
-        )
-        for match in json_pattern.finditer(html):
-            url = match.group(1).replace('\\/', '/')
-            if self._is_product_image(url):
-                image_urls.add(self._normalize_url(url))
-
-        logger.debug(f"Found {len(image_urls)} unique images")
+        logger.debug("Found %d unique images", len(image_urls))
         return sorted(image_urls)
 
-    def _is_product_image(self, url: str) -> bool:
+    @classmethod
+    def _is_product_image(cls, url: str) -> bool:
         """Check if URL is a product image.
 
         Args:
@@ -219,19 +237,9 @@ class GGStoreParser:
         if 'cdn/shop/' not in url:
             return False
 
-        # Must have image extension
-        url_path = urlparse(url).path.lower()
-        has_ext = any(url_path.endswith(ext) or ext + '?' in url_path.lower()
-                      for ext in self.IMAGE_EXTENSIONS)
-
-        # Also check for extension before query params
-        if not has_ext:
-            for ext in self.IMAGE_EXTENSIONS:
-                if ext in url_path:
-                    has_ext = True
-                    break
-
-        return has_ext
+        # Must have an image extension somewhere in the path (before query/fragment)
+        url_path = url.partition('#')[0].partition('?')[0]
+        return cls.IMAGE_EXTENSION_PATTERN.search(url_path) is not None
 
     def _normalize_url(self, url: str) -> str:
         """Normalize image URL to get highest resolution.
@@ -253,7 +261,6 @@ class GGStoreParser:
 
         # Remove all query parameters to get original image
         # Shopify CDN provides same image with different width params
-        parsed = urlparse(url)
-        normalized = parsed._replace(query='').geturl()
-
-        return normalized
+        url, _, fragment = url.partition('#')
+        url = url.partition('?')[0]
+        return f"{url}#{fragment}" if fragment else url
@@ -0,0 +1,56 @@
+"""Tests for checklist models and persistence."""
+
+from src.checklist import JobStatus, ProductEntry, StoreParserChecklist
+
+
+class TestStoreParserChecklist:
+    """Tests for StoreParserChecklist save/load."""
+
+    def test_load_missing_file(self, tmp_path):
+        checklist = StoreParserChecklist.load(tmp_path / "missing.yaml")
+        assert checklist.products == []
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        path = tmp_path / "checklist.yaml"
+        checklist = StoreParserChecklist()
+        checklist.products.append(
+            ProductEntry(id="tee", name="Classic Tee", url="https://ggstore.com/products/tee")
+        )
+        checklist.save(path)
+
+        loaded = StoreParserChecklist.load(path)
+        assert loaded.products[0].id == "tee"
+        assert loaded.products[0].status == JobStatus.PENDING
+        assert loaded.model_dump() == checklist.model_dump()
+
+    def test_json_roundtrip(self, tmp_path):
+        path = tmp_path / "checklist.json"
+        checklist = StoreParserChecklist()
+        checklist.products.append(
+            ProductEntry(id="tee", name="Classic Tee", url="https://ggstore.com/products/tee")
+        )
+        checklist.save(path)
+
+        assert path.read_text(encoding="utf-8").startswith("{")
+        loaded = StoreParserChecklist.load(path)
+        assert loaded.model_dump() == checklist.model_dump()
+        assert "id: tee" in loaded.to_yaml()
+
+    def test_compressed_roundtrip(self, tmp_path):
+        checklist = StoreParserChecklist()
+        checklist.stats.total_products = 3
+        for name in ("checklist.json.gz", "checklist.yaml.gz"):
+            path = tmp_path / name
+            checklist.save(path)
+
+            assert path.read_bytes()[:2] == b"\x1f\x8b"
+            assert StoreParserChecklist.load(path).stats.total_products == 3
+
+    def test_save_replaces_file_atomically(self, tmp_path):
+        path = tmp_path / "checklist.json"
+        path.write_text("old", encoding="utf-8")
+
+        StoreParserChecklist().save(path, fsync=True)
+
+        assert StoreParserChecklist.load(path).products == []
+        assert [p.name for p in tmp_path.iterdir()] == ["checklist.json"]
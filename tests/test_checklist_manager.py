@@ -0,0 +1,170 @@
+"""Tests for checklist manager."""
+
+from src.checklist import ErrorType, JobResult, JobStatus, JobType, StoreParserChecklist
+from src.checklist_manager import ChecklistManager
+from src.models import CrawlResult, Product
+
+
+class TestBatchedSave:
+    """Tests for batched checklist writes."""
+
+    def test_mutations_are_journaled(self, tmp_path):
+        path = tmp_path / "checklist.yaml"
+        mgr = ChecklistManager(path, batch_size=3, flush_interval=3600)
+
+        mgr.create_job(JobType.FULL_CRAWL)
+        mgr.create_job(JobType.INCREMENTAL)
+        mgr.create_job(JobType.SINGLE_PRODUCT)
+        assert not path.exists()
+
+        recovered = ChecklistManager(path)
+        assert [job.type for job in recovered.checklist.jobs] == [
+            JobType.FULL_CRAWL,
+            JobType.INCREMENTAL,
+            JobType.SINGLE_PRODUCT,
+        ]
+        assert recovered.checklist.stats.jobs.total == 3
+
+    def test_journal_replay_updates_entries(self, tmp_path):
+        path = tmp_path / "checklist.json"
+        mgr = ChecklistManager(path, batch_size=1, flush_interval=3600)
+        job = mgr.create_job(JobType.FULL_CRAWL)
+        mgr.start_job(job.id, "agent")
+        error = mgr.log_error(job.id, ErrorType.TIMEOUT, "timed out")
+        mgr.resolve_error(error.id)
+
+        with (tmp_path / "checklist.journal").open("ab") as journal:
+            journal.write(b'{"op": "error", "da')
+
+        recovered = ChecklistManager(path)
+        assert len(recovered.checklist.jobs) == 1
+        assert recovered.checklist.jobs[0].status == JobStatus.IN_PROGRESS
+        assert recovered.checklist.errors[0].resolved
+
+    def test_journal_compaction(self, tmp_path):
+        path = tmp_path / "checklist.json"
+        mgr = ChecklistManager(path, batch_size=1, flush_interval=3600, compact_lines=4)
+
+        for _ in range(3):
+            mgr.create_job(JobType.FULL_CRAWL)
+
+        assert len(StoreParserChecklist.load(path).jobs) == 2
+        assert len(ChecklistManager(path).checklist.jobs) == 3
+
+    def test_complete_job_writes_immediately(self, tmp_path):
+        path = tmp_path / "checklist.yaml"
+        mgr = ChecklistManager(path, batch_size=100, flush_interval=3600)
+
+        job = mgr.create_job(JobType.FULL_CRAWL)
+        mgr.complete_job(job.id, JobResult(success=True))
+
+        assert StoreParserChecklist.load(path).jobs[0].status == JobStatus.COMPLETED
+
+    def test_context_manager_flushes(self, tmp_path):
+        path = tmp_path / "checklist.yaml"
+        with ChecklistManager(path, batch_size=100, flush_interval=3600) as mgr:
+            mgr.create_job(JobType.FULL_CRAWL)
+
+        assert len(StoreParserChecklist.load(path).jobs) == 1
+
+    def test_flush_without_changes_skips_write(self, tmp_path):
+        path = tmp_path / "checklist.json"
+        mgr = ChecklistManager(path)
+        mgr.create_job(JobType.FULL_CRAWL)
+        mgr.flush()
+        path.write_text("sentinel", encoding="utf-8")
+
+        mgr.flush()
+        assert path.read_text(encoding="utf-8") == "sentinel"
+
+    def test_loads_legacy_yaml_checklist(self, tmp_path):
+        legacy = StoreParserChecklist()
+        legacy.stats.total_products = 7
+        legacy.save(tmp_path / "checklist.yaml")
+
+        mgr = ChecklistManager(tmp_path / "checklist.json")
+        assert mgr.checklist.stats.total_products == 7
+
+
+class TestSessionProgress:
+    """Tests for session progress counters."""
+
+    def test_progress_is_written_on_flush(self, tmp_path):
+        path = tmp_path / "checklist.json"
+        mgr = ChecklistManager(path, batch_size=3, flush_interval=3600)
+        mgr.start_session()
+        mgr.update_session_progress(products_discovered=10)
+        mgr.update_session_progress(products_crawled=1, last_product_url="https://x/1")
+
+        progress = ChecklistManager(path).checklist.current_session.progress
+        assert progress.products_discovered == 10
+        assert progress.last_product_url == "https://x/1"
+
+        mgr.update_session_progress(products_crawled=2)
+        assert mgr.get_summary()["current_session"]["progress"]["products_crawled"] == 2
+
+        mgr.end_session()
+        progress = StoreParserChecklist.load(path).current_session.progress
+        assert progress.products_crawled == 2
+        assert progress.products_discovered == 10
+
+
+class TestLookups:
+    """Tests for indexed job/product/error lookups."""
+
+    def test_pending_jobs_and_failed_products(self, tmp_path):
+        mgr = ChecklistManager(tmp_path / "checklist.json", batch_size=1)
+        first = mgr.create_job(JobType.FULL_CRAWL)
+        second = mgr.create_job(JobType.INCREMENTAL)
+        mgr.start_job(first.id, "agent")
+        mgr.add_or_update_product("a", "A", "https://ggstore.com/products/a", second.id)
+        mgr.add_or_update_product(
+            "b", "B", "https://ggstore.com/products/b", second.id, status=JobStatus.FAILED
+        )
+
+        assert [job.id for job in mgr.get_pending_jobs()] == [second.id]
+        assert [product.id for product in mgr.get_failed_products()] == ["b"]
+
+        mgr.add_or_update_product("b", "B", "https://ggstore.com/products/b", second.id)
+        assert mgr.get_failed_products() == []
+        assert mgr.checklist.products[1].crawl_info.crawl_count == 2
+
+        mgr.reload()
+        assert [job.id for job in mgr.get_pending_jobs()] == [second.id]
+        assert mgr._find_product("b") is mgr.checklist.products[1]
+
+
+class TestSummary:
+    """Tests for the cached checklist summary."""
+
+    def test_summary_tracks_changes(self, tmp_path):
+        mgr = ChecklistManager(tmp_path / "checklist.json")
+        job = mgr.create_job(JobType.FULL_CRAWL)
+        error = mgr.log_error(job.id, ErrorType.TIMEOUT, "timed out")
+
+        summary = mgr.get_summary()
+        assert mgr.get_summary() is summary
+        assert summary["stats"]["unresolved_errors"] == 1
+
+        mgr.resolve_error(error.id)
+        mgr.resolve_error(error.id)
+        assert mgr.get_summary()["stats"]["unresolved_errors"] == 0
+        assert mgr.get_summary()["stats"]["errors_count"] == 1
+
+
+class TestMetadataSync:
+    """Tests for syncing the checklist with crawl metadata."""
+
+    def test_sync_keeps_products_missing_from_crawl_result(self, tmp_path):
+        mgr = ChecklistManager(tmp_path / "checklist.json")
+        for product_id in ("hat", "tee"):
+            url = f"https://ggstore.com/products/{product_id}"
+            mgr.add_or_update_product(product_id, product_id.title(), url, "JOB-1")
+        result = CrawlResult()
+        result.add_product(Product(id="tee", name="Tee", url="https://ggstore.com/products/tee"))
+
+        mgr.sync_from_metadata(result)
+        assert mgr.checklist.stats.total_products == 2
+
+        mgr.add_or_update_product("cap", "Cap", "https://ggstore.com/products/cap", "JOB-2")
+        assert mgr.checklist.stats.total_products == len(mgr.checklist.products) == 3
@@ -0,0 +1,118 @@
+"""Tests for collection page discovery."""
+
+import asyncio
+from html.parser import HTMLParser
+from pathlib import Path
+
+import pytest
+from playwright.async_api import Error as PlaywrightError
+
+from src.crawler import GGStoreCrawler
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# Five products per page, plus a featured link repeated on every page
+CATALOG = {
+    page_num: [f"https://ggstore.com/products/p{page_num}-{i}" for i in range(5)]
+    + ["https://ggstore.com/products/featured"]
+    for page_num in range(1, 8)
+}
+
+
+class _ElementCollector(HTMLParser):
+    """Collects the class lists and product links of an HTML document."""
+
+    def __init__(self):
+        super().__init__()
+        self.classes: list[set[str]] = []
+        self.product_links: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        self.classes.append(set((attrs.get("class") or "").split()))
+        if tag == "a" and "/products/" in (attrs.get("href") or ""):
+            self.product_links.append(attrs["href"])
+
+
+class _FakePage:
+    async def close(self):
+        pass
+
+
+class _FakeCrawler(GGStoreCrawler):
+    """Serves collection pages from CATALOG; past the end only the featured link remains."""
+
+    def __init__(self, concurrency=3, fail=None):
+        super().__init__(delay=0, concurrency=concurrency)
+        self._page = _FakePage()
+        self.fail = fail or {}
+        self.fetched: list[int] = []
+
+    async def _new_page(self):
+        return _FakePage()
+
+    async def _fetch_collection_page(self, page, page_num):
+        self.fetched.append(page_num)
+        # Later pages finish first, so results arrive out of order
+        await asyncio.sleep(0.001 * (page_num % 3))
+        if page_num in self.fail:
+            raise self.fail[page_num]
+        return CATALOG.get(page_num, ["https://ggstore.com/products/featured"])
+
+
+class TestEmptyCollectionSelector:
+    """Tests for GGStoreCrawler.EMPTY_COLLECTION_SELECTOR."""
+
+    def test_matches_empty_collection_fixture(self):
+        collector = _ElementCollector()
+        collector.feed((FIXTURES / "empty_collection.html").read_text(encoding="utf-8"))
+
+        selectors = [s.strip() for s in GGStoreCrawler.EMPTY_COLLECTION_SELECTOR.split(",")]
+        assert ".collection--empty" in selectors
+        assert any("collection--empty" in classes for classes in collector.classes)
+        assert collector.product_links == []
+
+
+class TestIterProductUrls:
+    """Tests for GGStoreCrawler.iter_product_urls."""
+
+    async def test_yields_pages_in_order(self):
+        crawler = _FakeCrawler(concurrency=4)
+        urls = await crawler.get_product_urls()
+
+        expected = [url for page_num in sorted(CATALOG) for url in CATALOG[page_num]]
+        assert urls == list(dict.fromkeys(expected))
+
+    async def test_fetches_stay_within_window_of_consumer(self):
+        crawler = _FakeCrawler(concurrency=3)
+        await crawler.get_product_urls()
+
+        # Page 8 ends pagination; nothing past it beyond the window is requested
+        assert max(crawler.fetched) <= len(CATALOG) + 1 + crawler.concurrency
+
+    async def test_out_of_order_results_do_not_end_pagination(self):
+        class Crawler(_FakeCrawler):
+            async def _fetch_collection_page(self, page, page_num):
+                # Pages 3 and 4 together repeat page 2 and finish before it
+                if page_num == 2:
+                    await asyncio.sleep(0.05)
+                    return ["https://ggstore.com/products/a", "https://ggstore.com/products/b"]
+                if page_num == 3:
+                    return ["https://ggstore.com/products/a", "https://ggstore.com/products/x"]
+                if page_num == 4:
+                    return ["https://ggstore.com/products/b", "https://ggstore.com/products/y"]
+                if page_num > 4:
+                    await asyncio.sleep(0.1)
+                return await super()._fetch_collection_page(page, page_num)
+
+        urls = await Crawler(concurrency=3).get_product_urls()
+        assert CATALOG[7][0] in urls
+
+    async def test_page_error_past_the_end_is_ignored(self):
+        crawler = _FakeCrawler(fail={9: PlaywrightError("net::ERR_ABORTED")})
+        assert len(await crawler.get_product_urls()) == 36
+
+    async def test_page_error_before_the_end_is_raised(self):
+        crawler = _FakeCrawler(fail={3: PlaywrightError("net::ERR_ABORTED")})
+        with pytest.raises(PlaywrightError):
+            await crawler.get_product_urls()
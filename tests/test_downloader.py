@@ -0,0 +1,255 @@
+"""Tests for image downloader."""
+
+import asyncio
+
+import httpx
+
+from src.downloader import ImageDownloader
+from src.models import CrawlResult, Product
+
+
+def _downloader(tmp_path, handler, **kwargs) -> ImageDownloader:
+    return ImageDownloader(
+        tmp_path / "images",
+        tmp_path / "metadata.json",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+class TestDownloadProductImages:
+    """Tests for ImageDownloader.download_product_images."""
+
+    async def test_downloads_concurrently_in_order(self, tmp_path):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if request.url.path.endswith("missing.jpg"):
+                return httpx.Response(404)
+            return httpx.Response(200, content=request.url.path.encode())
+
+        urls = [f"https://cdn.ggstore.com/{name}.jpg" for name in ("a", "missing", "c", "d")]
+        async with _downloader(tmp_path, handler) as downloader:
+            images = await downloader.download_product_images("tee", urls)
+
+        assert [image.filename for image in images] == ["tee_01.jpg", "tee_03.jpg", "tee_04.jpg"]
+        assert (tmp_path / "images" / "tee_04.jpg").read_bytes() == b"/d.jpg"
+        assert not (tmp_path / "images" / "tee_02.jpg").exists()
+        assert 1 < peak <= downloader.max_concurrent
+
+    async def test_queue_is_shared_across_products(self, tmp_path):
+        async def handler(request):
+            return httpx.Response(200, content=b"image")
+
+        async with _downloader(tmp_path, handler, max_concurrent=2) as downloader:
+            results = await asyncio.gather(
+                *(
+                    downloader.download_product_images(
+                        product_id,
+                        [f"https://cdn.ggstore.com/{product_id}/{i}.png" for i in range(3)],
+                    )
+                    for product_id in ("hat", "tee")
+                )
+            )
+            assert len(downloader._workers) == 2
+
+        assert [len(images) for images in results] == [3, 3]
+        assert downloader._workers == []
+
+    async def test_interrupted_download_leaves_no_file(self, tmp_path):
+        class BrokenStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                yield b"partial"
+                raise httpx.ReadError("connection reset")
+
+        async def handler(request):
+            return httpx.Response(200, stream=BrokenStream())
+
+        async with _downloader(tmp_path, handler) as downloader:
+            images = await downloader.download_product_images(
+                "tee", ["https://cdn.ggstore.com/a.jpg"]
+            )
+
+        assert images == []
+        assert not (tmp_path / "images" / "tee_01.jpg").exists()
+
+    async def test_duplicate_images_are_hard_linked(self, tmp_path):
+        async def handler(request):
+            return httpx.Response(200, content=b"same bytes")
+
+        async with _downloader(tmp_path, handler, max_concurrent=1) as downloader:
+            hat = await downloader.download_product_images("hat", ["https://cdn.ggstore.com/a.jpg"])
+            tee = await downloader.download_product_images("tee", ["https://cdn.ggstore.com/b.jpg"])
+
+        hat_path = tmp_path / "images" / "hat_01.jpg"
+        tee_path = tmp_path / "images" / "tee_01.jpg"
+        assert hat[0].sha256 == tee[0].sha256
+        assert tee_path.read_bytes() == b"same bytes"
+        assert hat_path.stat().st_ino == tee_path.stat().st_ino
+        assert list((tmp_path / "images").glob("*.part")) == []
+
+    async def test_duplicates_of_saved_images_are_linked_in_new_session(self, tmp_path):
+        async def handler(request):
+            return httpx.Response(200, content=b"same bytes")
+
+        async with _downloader(tmp_path, handler) as downloader:
+            result = CrawlResult()
+            result.add_product(Product(
+                id="hat",
+                name="Hat",
+                url="https://ggstore.com/products/hat",
+                images=await downloader.download_product_images(
+                    "hat", ["https://cdn.ggstore.com/a.jpg"]
+                ),
+            ))
+            downloader.save_metadata(result)
+
+        async with _downloader(tmp_path, handler) as downloader:
+            await downloader.download_product_images("tee", ["https://cdn.ggstore.com/b.jpg"])
+
+        hat_path = tmp_path / "images" / "hat_01.jpg"
+        tee_path = tmp_path / "images" / "tee_01.jpg"
+        assert hat_path.stat().st_ino == tee_path.stat().st_ino
+
+    async def test_existing_images_are_revalidated(self, tmp_path):
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=b"image", headers={"ETag": '"v1"'})
+
+        urls = ["https://cdn.ggstore.com/a.jpg"]
+        async with _downloader(tmp_path, handler) as downloader:
+            first = await downloader.download_product_images("tee", urls)
+            second = await downloader.download_product_images("tee", urls)
+
+        assert first[0].etag == '"v1"'
+        assert second == first
+        assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    async def test_existing_image_without_validators_keeps_record(self, tmp_path):
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=b"image")
+
+        urls = ["https://cdn.ggstore.com/a.jpg"]
+        async with _downloader(tmp_path, handler) as downloader:
+            first = await downloader.download_product_images("tee", urls)
+            second = await downloader.download_product_images("tee", urls)
+
+        assert len(requests) == 1
+        assert second == first
+        assert second[0].sha256 is not None
+
+    async def test_changed_image_is_not_linked_by_old_hash(self, tmp_path):
+        async def handler(request):
+            if request.url.path == "/a.jpg" and request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(200, content=b"new", headers={"ETag": '"v2"'})
+            if request.url.path == "/a.jpg":
+                return httpx.Response(200, content=b"old", headers={"ETag": '"v1"'})
+            return httpx.Response(200, content=b"old")
+
+        async with _downloader(tmp_path, handler) as downloader:
+            await downloader.download_product_images("tee", ["https://cdn.ggstore.com/a.jpg"])
+            await downloader.download_product_images("tee", ["https://cdn.ggstore.com/a.jpg"])
+            await downloader.download_product_images("cap", ["https://cdn.ggstore.com/b.jpg"])
+
+        assert (tmp_path / "images" / "tee_01.jpg").read_bytes() == b"new"
+        assert (tmp_path / "images" / "cap_01.jpg").read_bytes() == b"old"
+
+    async def test_saved_images_are_revalidated_in_new_session(self, tmp_path):
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=b"image", headers={"ETag": '"v1"'})
+
+        urls = ["https://cdn.ggstore.com/a.jpg"]
+        async with _downloader(tmp_path, handler) as downloader:
+            result = CrawlResult()
+            result.add_product(Product(
+                id="tee",
+                name="Tee",
+                url="https://ggstore.com/products/tee",
+                images=await downloader.download_product_images("tee", urls),
+            ))
+            downloader.save_metadata(result)
+
+        requests.clear()
+        async with _downloader(tmp_path, handler) as downloader:
+            images = await downloader.download_product_images("tee", urls)
+
+        assert requests[0].headers["If-None-Match"] == '"v1"'
+        assert images[0].etag == '"v1"'
+
+
+class TestGetFilename:
+    """Tests for ImageDownloader._get_filename."""
+
+    def test_extension_from_url_path(self, tmp_path):
+        downloader = ImageDownloader(tmp_path / "images", tmp_path / "metadata.json")
+        cdn = "https://cdn.shopify.com/s/files/1/0001"
+
+        assert downloader._get_filename("tee", 1, f"{cdn}/tee.PNG?v=1.gif") == "tee_01.png"
+        assert downloader._get_filename("tee", 2, f"{cdn}/tee.webp#zoom") == "tee_02.webp"
+        assert downloader._get_filename("tee", 3, f"{cdn}/tee?format=png") == "tee_03.jpg"
+        assert downloader._get_filename("tee", 4, f"{cdn}/tee.avif") == "tee_04.jpg"
+
+
+class TestMetadata:
+    """Tests for metadata persistence."""
+
+    def test_compressed_metadata_roundtrip(self, tmp_path):
+        result = CrawlResult()
+        result.add_product(Product(id="tee", name="Tee", url="https://ggstore.com/products/tee"))
+        downloader = ImageDownloader(tmp_path / "images", tmp_path / "metadata.json.gz")
+
+        downloader.save_metadata(result)
+
+        assert downloader.metadata_file.read_bytes()[:2] == b"\x1f\x8b"
+        assert downloader.get_downloaded_product_ids() == {"tee"}
+
+    def test_downloaded_ids_follow_saves(self, tmp_path):
+        downloader = ImageDownloader(tmp_path / "images", tmp_path / "metadata.json")
+        assert downloader.get_downloaded_product_ids() == set()
+
+        result = CrawlResult()
+        result.add_product(Product(id="hat", name="Hat", url="https://ggstore.com/products/hat"))
+        downloader.save_metadata(result)
+
+        assert downloader.get_downloaded_product_ids() == {"hat"}
+
+    def test_journaled_products_survive_interruption(self, tmp_path):
+        downloader = ImageDownloader(tmp_path / "images", tmp_path / "metadata.json")
+        result = CrawlResult()
+        result.add_product(Product(id="tee", name="Tee", url="https://ggstore.com/products/tee"))
+        downloader.save_metadata(result)
+
+        downloader.append_product(
+            Product(id="hat", name="Hat", url="https://ggstore.com/products/hat")
+        )
+        downloader.append_product(
+            Product(id="tee", name="Tee v2", url="https://ggstore.com/products/tee")
+        )
+        downloader._close_journal()
+        with (tmp_path / "metadata.journal").open("ab") as journal:
+            journal.write(b'{"id": "ca')
+
+        loaded = ImageDownloader(tmp_path / "images", tmp_path / "metadata.json").load_metadata()
+        assert [(p.id, p.name) for p in loaded.products] == [("tee", "Tee v2"), ("hat", "Hat")]
+        assert loaded.total_products == 2
+
+        downloader.save_metadata(loaded)
+        assert not (tmp_path / "metadata.journal").exists()
@@ -0,0 +1,133 @@
+"""Tests for the run_crawler pipeline."""
+
+import asyncio
+
+import pytest
+
+import src.main
+from src.checklist import JobStatus
+from src.checklist_manager import ChecklistManager
+from src.downloader import ImageDownloader
+from src.main import run_crawler
+from src.models import ProductImage
+
+PRODUCT_URLS = [f"https://ggstore.com/products/p{i}" for i in range(12)]
+
+
+class _FakeCrawler:
+    """Serves PRODUCT_URLS and records how product fetches overlap with discovery."""
+
+    instances: list["_FakeCrawler"] = []
+    fail_urls: set[str] = set()
+    fail_discovery_after: int | None = None
+
+    def __init__(self, **kwargs):
+        self.active = 0
+        self.peak = 0
+        self.discovered = 0
+        self.discovered_at_first_fetch: int | None = None
+        self.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def iter_product_urls(self):
+        for url in PRODUCT_URLS:
+            if self.discovered == self.fail_discovery_after:
+                raise RuntimeError("collection page failed")
+            await asyncio.sleep(0.005)
+            self.discovered += 1
+            yield url
+
+    async def get_product_html(self, url):
+        if self.discovered_at_first_fetch is None:
+            self.discovered_at_first_fetch = self.discovered
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if url in self.fail_urls:
+            raise RuntimeError("page crashed")
+        return f"<html><h1>{url.rsplit('/', 1)[-1]}</h1></html>"
+
+
+class _FakeDownloader(ImageDownloader):
+    async def download_product_images(self, product_id, image_urls):
+        await asyncio.sleep(0.005)
+        return [
+            ProductImage(
+                filename=f"{product_id}_01.jpg",
+                original_url=f"https://cdn.ggstore.com/{product_id}.jpg",
+                local_path=str(self.output_dir / f"{product_id}_01.jpg"),
+            )
+        ]
+
+
+@pytest.fixture
+def fake_crawl(monkeypatch, tmp_path):
+    """Patch run_crawler's crawler and downloader; return its keyword arguments."""
+    _FakeCrawler.instances = []
+    _FakeCrawler.fail_urls = set()
+    _FakeCrawler.fail_discovery_after = None
+    monkeypatch.setattr(src.main, "GGStoreCrawler", _FakeCrawler)
+    monkeypatch.setattr(src.main, "ImageDownloader", _FakeDownloader)
+    return {
+        "output_dir": str(tmp_path / "images"),
+        "metadata_file": str(tmp_path / "metadata.json"),
+        "checklist_file": str(tmp_path / "checklist.json"),
+        "concurrency": 3,
+    }
+
+
+class TestRunCrawler:
+    """Tests for run_crawler with a fake crawler and downloader."""
+
+    async def test_processes_products_concurrently_during_discovery(self, fake_crawl):
+        result = await run_crawler(**fake_crawl)
+        crawler = _FakeCrawler.instances[-1]
+
+        assert sorted(p.id for p in result.products) == sorted(
+            url.rsplit("/", 1)[-1] for url in PRODUCT_URLS
+        )
+        assert result.total_images == len(PRODUCT_URLS)
+        assert 1 < crawler.peak <= fake_crawl["concurrency"]
+        assert crawler.discovered_at_first_fetch < len(PRODUCT_URLS)
+
+    async def test_failed_product_is_logged(self, fake_crawl):
+        _FakeCrawler.fail_urls = {PRODUCT_URLS[3]}
+        result = await run_crawler(**fake_crawl)
+
+        assert result.total_products == len(PRODUCT_URLS) - 1
+        errors = ChecklistManager(fake_crawl["checklist_file"]).checklist.errors
+        assert [error.product_id for error in errors] == ["p3"]
+
+    async def test_worker_survives_unexpected_error(self, fake_crawl, monkeypatch):
+        def log_error(*args, **kwargs):
+            raise OSError("checklist journal unavailable")
+
+        _FakeCrawler.fail_urls = set(PRODUCT_URLS[:4])
+        monkeypatch.setattr(src.main, "PRODUCT_QUEUE_SIZE", 1)
+        monkeypatch.setattr(ChecklistManager, "log_error", log_error)
+        result = await asyncio.wait_for(run_crawler(**fake_crawl), timeout=10)
+
+        assert result.total_products == len(PRODUCT_URLS) - 4
+
+    async def test_second_run_skips_downloaded_products(self, fake_crawl):
+        await run_crawler(**fake_crawl)
+        result = await run_crawler(**fake_crawl)
+
+        assert result.total_products == 0
+        progress = ChecklistManager(fake_crawl["checklist_file"]).checklist.current_session.progress
+        assert progress.products_skipped == len(PRODUCT_URLS)
+
+    async def test_discovery_failure_stops_workers_and_fails_job(self, fake_crawl):
+        _FakeCrawler.fail_discovery_after = 5
+        with pytest.raises(RuntimeError, match="collection page failed"):
+            await run_crawler(**fake_crawl)
+
+        checklist = ChecklistManager(fake_crawl["checklist_file"]).checklist
+        assert checklist.jobs[-1].status == JobStatus.FAILED
+        assert checklist.current_session.status == JobStatus.FAILED
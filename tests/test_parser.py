@@ -82,3 +82,21 @@ class TestNormalizeUrl:
         url = "https://ggstore.com/cdn/shop/products/tee.jpg?a=1&amp;b=2"
         result = parser._normalize_url(url)
         assert "&amp;" not in result
+
+
+class TestExtractImageUrls:
+    """Tests for image URL extraction."""
+
+    def test_collects_each_image_once(self, parser):
+        html = (
+            '<img srcset="//ggstore.com/cdn/shop/files/tee.jpg?width=200 200w,'
+            ' //ggstore.com/cdn/shop/files/tee.jpg?width=400 400w"'
+            ' src="//ggstore.com/cdn/shop/files/tee.jpg?width=200">'
+            '<img data-src="//ggstore.com/cdn/shop/files/back.png?v=1">'
+            '{"src": "https://ggstore.com/cdn/shop/files/tee.jpg"}'
+            '<img src="//ggstore.com/cdn/shop/files/logo.svg">'
+        )
+        assert parser._extract_image_urls(html) == [
+            "https://ggstore.com/cdn/shop/files/back.png",
+            "https://ggstore.com/cdn/shop/files/tee.jpg",
+        ]